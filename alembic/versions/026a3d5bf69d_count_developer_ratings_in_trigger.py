@@ -0,0 +1,58 @@
+"""count developer ratings in trigger
+
+Revision ID: 026a3d5bf69d
+Revises: a256dae69c81
+Create Date: 2026-10-18 02:20:43.332400
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '026a3d5bf69d'
+down_revision: Union[str, None] = 'a256dae69c81'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _refresh_function(set_clause: str) -> str:
+    return f"""
+        CREATE OR REPLACE FUNCTION developer_rating_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE developer_profiles
+                SET {set_clause.format(developer_id="OLD.developer_id")}
+                WHERE id = OLD.developer_id;
+            END IF;
+            IF TG_OP = 'INSERT' OR NEW.developer_id IS DISTINCT FROM OLD.developer_id THEN
+                UPDATE developer_profiles
+                SET {set_clause.format(developer_id="NEW.developer_id")}
+                WHERE id = NEW.developer_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+
+
+RATING = "rating = COALESCE((SELECT avg(stars) FROM developer_ratings WHERE developer_id = {developer_id}), 0)"
+TOTAL = "total_ratings = (SELECT count(*) FROM developer_ratings WHERE developer_id = {developer_id})"
+
+
+def upgrade() -> None:
+    op.add_column('developer_profiles', sa.Column('total_ratings', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE developer_profiles p
+        SET total_ratings = (SELECT count(*) FROM developer_ratings WHERE developer_id = p.id)
+        """
+    )
+    op.execute(_refresh_function(RATING + ",\n                    " + TOTAL))
+
+
+def downgrade() -> None:
+    op.execute(_refresh_function(RATING))
+    op.drop_column('developer_profiles', 'total_ratings')
@@ -0,0 +1,29 @@
+"""index public request feed
+
+Revision ID: 1026a7cb5e7a
+Revises: 9ce8aece232d
+Create Date: 2026-10-18 02:07:18.827243
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1026a7cb5e7a'
+down_revision: Union[str, None] = '9ce8aece232d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_requests_public_created', 'requests', ['created_at'], unique=False, postgresql_where=sa.text('is_public'), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_requests_public_created', table_name='requests', postgresql_concurrently=True)
@@ -0,0 +1,78 @@
+"""fill rating showcase and subscription timestamps on the server
+
+Revision ID: 10ce1d3e71c4
+Revises: 406d399451ad
+Create Date: 2026-10-18 01:43:44.651188
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '10ce1d3e71c4'
+down_revision: Union[str, None] = '406d399451ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, NOT NULL with a now() default after upgrade)
+TIMESTAMP_COLUMNS = [
+    ('oauth_connections', 'created_at', True),
+    ('video_ratings', 'created_at', True),
+    ('showcase_ratings', 'created_at', True),
+    ('showcases', 'created_at', True),
+    ('showcases', 'updated_at', True),
+    ('subscriptions', 'created_at', True),
+    ('subscriptions', 'updated_at', False),
+]
+
+
+def _drop_leaderboard():
+    # showcase_leaderboard reads showcases.updated_at, which blocks ALTER TYPE;
+    # keep its definition so it can be rebuilt unchanged afterwards
+    definition = op.get_bind().execute(
+        sa.text("SELECT pg_get_viewdef('showcase_leaderboard'::regclass)")
+    ).scalar()
+    op.execute("DROP MATERIALIZED VIEW showcase_leaderboard")
+    return definition
+
+
+def _create_leaderboard(definition):
+    op.execute(f"CREATE MATERIALIZED VIEW showcase_leaderboard AS {definition}")
+    op.create_index('ix_showcase_leaderboard_id', 'showcase_leaderboard', ['id'], unique=True)
+    op.create_index('ix_showcase_leaderboard_ranking_score', 'showcase_leaderboard', [sa.text('ranking_score DESC')], unique=False)
+
+
+def upgrade() -> None:
+    leaderboard = _drop_leaderboard()
+    # Existing values were written with datetime.utcnow(), i.e. naive UTC
+    for table, column, not_null in TIMESTAMP_COLUMNS:
+        using = f"{column} AT TIME ZONE 'UTC'"
+        if not_null:
+            using = f"COALESCE({using}, now())"
+        op.alter_column(
+            table,
+            column,
+            type_=sa.TIMESTAMP(timezone=True),
+            postgresql_using=using,
+            server_default=sa.text('now()') if not_null else None,
+            nullable=not not_null,
+        )
+    _create_leaderboard(leaderboard)
+
+
+def downgrade() -> None:
+    leaderboard = _drop_leaderboard()
+    for table, column, not_null in reversed(TIMESTAMP_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=None,
+            nullable=(table, column) != ('subscriptions', 'created_at'),
+        )
+    _create_leaderboard(leaderboard)
@@ -0,0 +1,29 @@
+"""cascade video rating deletes in the database
+
+Revision ID: 22212a261006
+Revises: 4fa08ff32e8a
+Create Date: 2026-10-18 02:43:18.336092
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '22212a261006'
+down_revision: Union[str, None] = '4fa08ff32e8a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Video.ratings is passive now, so the database has to remove them
+    op.drop_constraint('video_ratings_video_id_fkey', 'video_ratings', type_='foreignkey')
+    op.create_foreign_key('video_ratings_video_id_fkey', 'video_ratings', 'videos', ['video_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    op.drop_constraint('video_ratings_video_id_fkey', 'video_ratings', type_='foreignkey')
+    op.create_foreign_key('video_ratings_video_id_fkey', 'video_ratings', 'videos', ['video_id'], ['id'])
@@ -0,0 +1,53 @@
+"""add foreign key indexes
+
+Revision ID: 315eca2dce99
+Revises: 0611890d0360
+Create Date: 2026-10-18 01:23:08.406406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '315eca2dce99'
+down_revision: Union[str, None] = '0611890d0360'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_videos_project_id'), 'videos', ['project_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_videos_request_id'), 'videos', ['request_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_video_ratings_rater_id'), 'video_ratings', ['rater_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_showcase_ratings_rater_id'), 'showcase_ratings', ['rater_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_showcases_developer_id'), 'showcases', ['developer_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_showcases_developer_profile_id'), 'showcases', ['developer_profile_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_request_comments_request_id'), 'request_comments', ['request_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_request_comments_user_id'), 'request_comments', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_request_comments_parent_id'), 'request_comments', ['parent_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_request_comment_votes_comment_id'), 'request_comment_votes', ['comment_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_subscriptions_user_id'), 'subscriptions', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_snagged_requests_request_id'), 'snagged_requests', ['request_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_snagged_requests_developer_id'), 'snagged_requests', ['developer_id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_snagged_requests_developer_id'), table_name='snagged_requests', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_snagged_requests_request_id'), table_name='snagged_requests', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_subscriptions_user_id'), table_name='subscriptions', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_request_comment_votes_comment_id'), table_name='request_comment_votes', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_request_comments_parent_id'), table_name='request_comments', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_request_comments_user_id'), table_name='request_comments', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_request_comments_request_id'), table_name='request_comments', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_showcases_developer_profile_id'), table_name='showcases', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_showcases_developer_id'), table_name='showcases', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_showcase_ratings_rater_id'), table_name='showcase_ratings', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_video_ratings_rater_id'), table_name='video_ratings', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_videos_request_id'), table_name='videos', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_videos_project_id'), table_name='videos', postgresql_concurrently=True)
@@ -0,0 +1,29 @@
+"""index requests project id
+
+Revision ID: 382bb6b0dcc8
+Revises: 1026a7cb5e7a
+Create Date: 2026-10-18 02:11:35.938127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '382bb6b0dcc8'
+down_revision: Union[str, None] = '1026a7cb5e7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_requests_project_id', 'requests', ['project_id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_requests_project_id', table_name='requests', postgresql_concurrently=True)
@@ -0,0 +1,45 @@
+"""tune autovacuum for append only conversation messages
+
+Revision ID: 3eae9f61dbbe
+Revises: 10ce1d3e71c4
+Create Date: 2026-10-18 01:44:31.111918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3eae9f61dbbe'
+down_revision: Union[str, None] = '10ce1d3e71c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # conversation_messages only ever grows. Vacuum/analyze after ~1-2% new
+    # rows instead of the 20%/10% defaults so the visibility map (index-only
+    # scans on conversation_id, created_at) and planner stats keep up
+    op.execute(
+        """
+        ALTER TABLE conversation_messages SET (
+            autovacuum_vacuum_insert_scale_factor = 0.01,
+            autovacuum_vacuum_scale_factor = 0.02,
+            autovacuum_analyze_scale_factor = 0.02
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE conversation_messages RESET (
+            autovacuum_vacuum_insert_scale_factor,
+            autovacuum_vacuum_scale_factor,
+            autovacuum_analyze_scale_factor
+        )
+        """
+    )
@@ -0,0 +1,53 @@
+"""add showcase leaderboard materialized view
+
+Revision ID: 406d399451ad
+Revises: 9752d018cf7a
+Create Date: 2026-10-18 01:42:30.041431
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '406d399451ad'
+down_revision: Union[str, None] = '9752d018cf7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Same score the /project-showcase ranking endpoints computed per request:
+    # rating (0.5), recency relative to the newest/oldest showcase (0.3) and
+    # log-scaled rating count (0.2)
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW showcase_leaderboard AS
+        SELECT
+            s.id,
+            (
+                (COALESCE(s.average_rating, 0) - 1) / 4 * 0.5 +
+                CASE
+                    WHEN MAX(EXTRACT(EPOCH FROM s.updated_at)) OVER() - MIN(EXTRACT(EPOCH FROM s.updated_at)) OVER() = 0
+                    THEN 0.3
+                    ELSE (EXTRACT(EPOCH FROM s.updated_at) - MIN(EXTRACT(EPOCH FROM s.updated_at)) OVER()) /
+                        (MAX(EXTRACT(EPOCH FROM s.updated_at)) OVER() - MIN(EXTRACT(EPOCH FROM s.updated_at)) OVER()) * 0.3
+                END +
+                CASE
+                    WHEN MAX(LN(GREATEST(s.total_ratings, 1) + 1)) OVER() = 0
+                    THEN 0
+                    ELSE LN(GREATEST(s.total_ratings, 1) + 1) / MAX(LN(GREATEST(s.total_ratings, 1) + 1)) OVER() * 0.2
+                END
+            )::double precision AS ranking_score
+        FROM showcases s
+        """
+    )
+    # The unique index is what allows REFRESH ... CONCURRENTLY
+    op.create_index('ix_showcase_leaderboard_id', 'showcase_leaderboard', ['id'], unique=True)
+    op.create_index('ix_showcase_leaderboard_ranking_score', 'showcase_leaderboard', [sa.text('ranking_score DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW showcase_leaderboard")
@@ -0,0 +1,83 @@
+"""unique collaboration session per external ticket
+
+Revision ID: 4f07b07fce52
+Revises: 026a3d5bf69d
+Create Date: 2026-10-18 02:26:26.697316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f07b07fce52'
+down_revision: Union[str, None] = '026a3d5bf69d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Each session that repeats an earlier (external_ticket_id, source_system)
+# pair, mapped to the earliest session for that ticket
+DUPLICATE_SESSIONS = """
+    SELECT id, min(id) OVER (PARTITION BY external_ticket_id, source_system) AS keep_id
+    FROM collaboration_sessions
+"""
+
+DUPLICATE_PARTICIPANTS = """
+    SELECT id, min(id) OVER (PARTITION BY session_id, email) AS keep_id
+    FROM collaboration_participants
+"""
+
+
+def upgrade() -> None:
+    # create_collaboration_session never checked for an existing session, so
+    # fold duplicates into the earliest one: move their participants and
+    # messages over, merge repeated participants, then delete them
+    for table in ('collaboration_participants', 'collaboration_messages'):
+        op.execute(
+            f"""
+            UPDATE {table} c SET session_id = d.keep_id
+            FROM ({DUPLICATE_SESSIONS}) d
+            WHERE c.session_id = d.id AND d.id <> d.keep_id
+            """
+        )
+    # An email that joined several duplicates now appears more than once in
+    # the kept session; keep its earliest participant row and move the
+    # others' messages onto it
+    op.execute(
+        f"""
+        UPDATE collaboration_messages m SET participant_id = d.keep_id
+        FROM ({DUPLICATE_PARTICIPANTS}) d
+        WHERE m.participant_id = d.id AND d.id <> d.keep_id
+        """
+    )
+    op.execute(
+        f"""
+        DELETE FROM collaboration_participants p
+        USING ({DUPLICATE_PARTICIPANTS}) d
+        WHERE p.id = d.id AND d.id <> d.keep_id
+        """
+    )
+    op.execute(
+        f"""
+        DELETE FROM collaboration_sessions s
+        USING ({DUPLICATE_SESSIONS}) d
+        WHERE s.id = d.id AND d.id <> d.keep_id
+        """
+    )
+    # Build the index without blocking writes, then promote it to a constraint.
+    # A failed CONCURRENTLY build leaves an INVALID index behind; clear it so
+    # the migration can be re-run.
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS unique_collaboration_session_ticket")
+        op.create_index('unique_collaboration_session_ticket', 'collaboration_sessions', ['external_ticket_id', 'source_system'], unique=True, postgresql_concurrently=True)
+    op.execute(
+        "ALTER TABLE collaboration_sessions ADD CONSTRAINT unique_collaboration_session_ticket "
+        "UNIQUE USING INDEX unique_collaboration_session_ticket"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('unique_collaboration_session_ticket', 'collaboration_sessions', type_='unique')
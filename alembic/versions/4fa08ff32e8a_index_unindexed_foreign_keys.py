@@ -0,0 +1,48 @@
+"""index unindexed foreign keys
+
+Revision ID: 4fa08ff32e8a
+Revises: b90675c30367
+Create Date: 2026-10-18 02:39:15.286913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4fa08ff32e8a'
+down_revision: Union[str, None] = 'b90675c30367'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Foreign keys whose column isn't the leading column of any existing index
+FOREIGN_KEYS = [
+    ('user_tokens', 'user_id'),
+    ('oauth_connections', 'user_id'),
+    ('showcase_videos', 'video_id'),
+    ('video_playlists', 'creator_id'),
+    ('playlist_videos', 'video_id'),
+    ('projects', 'user_id'),
+    ('conversation_content_links', 'conversation_id'),
+    ('donations', 'user_id'),
+    ('collaboration_participants', 'session_id'),
+    ('collaboration_participants', 'user_id'),
+    ('collaboration_messages', 'participant_id'),
+    ('collaboration_attachments', 'message_id'),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table, column in FOREIGN_KEYS:
+            op.create_index(f'ix_{table}_{column}', table, [column], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in reversed(FOREIGN_KEYS):
+            op.drop_index(f'ix_{table}_{column}', table_name=table, postgresql_concurrently=True)
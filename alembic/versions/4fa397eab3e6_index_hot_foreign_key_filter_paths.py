@@ -0,0 +1,37 @@
+"""index hot foreign key filter paths
+
+Revision ID: 4fa397eab3e6
+Revises: ef97078a4b25
+Create Date: 2026-10-18 01:52:29.305037
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4fa397eab3e6'
+down_revision: Union[str, None] = 'ef97078a4b25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_requests_user_created', 'requests', ['user_id', 'created_at'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_conversations_starter_user_id', 'conversations', ['starter_user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_conversations_recipient_user_id', 'conversations', ['recipient_user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_conversation_messages_user_id', 'conversation_messages', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_showcase_content_links_showcase_id', 'showcase_content_links', ['showcase_id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_showcase_content_links_showcase_id', table_name='showcase_content_links', postgresql_concurrently=True)
+        op.drop_index('ix_conversation_messages_user_id', table_name='conversation_messages', postgresql_concurrently=True)
+        op.drop_index('ix_conversations_recipient_user_id', table_name='conversations', postgresql_concurrently=True)
+        op.drop_index('ix_conversations_starter_user_id', table_name='conversations', postgresql_concurrently=True)
+        op.drop_index('ix_requests_user_created', table_name='requests', postgresql_concurrently=True)
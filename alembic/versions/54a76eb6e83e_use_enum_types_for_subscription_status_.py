@@ -0,0 +1,39 @@
+"""use enum types for subscription status and content links
+
+Revision ID: 54a76eb6e83e
+Revises: 5965ddd481e2
+Create Date: 2026-10-18 01:31:57.312661
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '54a76eb6e83e'
+down_revision: Union[str, None] = '5965ddd481e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+subscription_status = postgresql.ENUM('active', 'canceled', 'past_due', 'expired', name='subscriptionstatus')
+content_link_type = postgresql.ENUM('video', 'profile', name='contentlinktype')
+
+
+def upgrade() -> None:
+    subscription_status.create(op.get_bind())
+    content_link_type.create(op.get_bind())
+    op.alter_column('subscriptions', 'status', existing_type=sa.String(), type_=subscription_status, existing_nullable=False, postgresql_using='status::subscriptionstatus')
+    op.alter_column('conversation_content_links', 'content_type', existing_type=sa.String(), type_=content_link_type, existing_nullable=False, postgresql_using='content_type::contentlinktype')
+    op.alter_column('showcase_content_links', 'content_type', existing_type=sa.String(), type_=content_link_type, existing_nullable=False, postgresql_using='content_type::contentlinktype')
+
+
+def downgrade() -> None:
+    op.alter_column('showcase_content_links', 'content_type', existing_type=content_link_type, type_=sa.String(), existing_nullable=False)
+    op.alter_column('conversation_content_links', 'content_type', existing_type=content_link_type, type_=sa.String(), existing_nullable=False)
+    op.alter_column('subscriptions', 'status', existing_type=subscription_status, type_=sa.String(), existing_nullable=False)
+    content_link_type.drop(op.get_bind())
+    subscription_status.drop(op.get_bind())
@@ -0,0 +1,111 @@
+"""maintain rating aggregates with triggers
+
+Revision ID: 55d8056a7cd8
+Revises: 315eca2dce99
+Create Date: 2026-10-18 01:28:45.050449
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '55d8056a7cd8'
+down_revision: Union[str, None] = '315eca2dce99'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Backfill from the rating tables before the columns become NOT NULL
+    op.execute(
+        """
+        UPDATE showcases s
+        SET average_rating = COALESCE(
+                (SELECT avg(stars) FROM showcase_ratings WHERE showcase_id = s.id), 0),
+            total_ratings = (SELECT count(*) FROM showcase_ratings WHERE showcase_id = s.id)
+        """
+    )
+    op.execute(
+        """
+        UPDATE developer_profiles p
+        SET rating = COALESCE(
+            (SELECT avg(stars) FROM developer_ratings WHERE developer_id = p.id), 0
+        )
+        """
+    )
+    op.alter_column('showcases', 'average_rating', existing_type=sa.Float(), nullable=False, server_default='0')
+    op.alter_column('showcases', 'total_ratings', existing_type=sa.Integer(), nullable=False, server_default='0')
+    op.alter_column('developer_profiles', 'rating', existing_type=sa.Float(), nullable=False, server_default='0')
+
+    op.execute(
+        """
+        CREATE FUNCTION showcase_rating_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE showcases
+                SET average_rating = COALESCE(
+                        (SELECT avg(stars) FROM showcase_ratings WHERE showcase_id = OLD.showcase_id), 0),
+                    total_ratings = (SELECT count(*) FROM showcase_ratings WHERE showcase_id = OLD.showcase_id)
+                WHERE id = OLD.showcase_id;
+            END IF;
+            IF TG_OP = 'INSERT' OR NEW.showcase_id IS DISTINCT FROM OLD.showcase_id THEN
+                UPDATE showcases
+                SET average_rating = COALESCE(
+                        (SELECT avg(stars) FROM showcase_ratings WHERE showcase_id = NEW.showcase_id), 0),
+                    total_ratings = (SELECT count(*) FROM showcase_ratings WHERE showcase_id = NEW.showcase_id)
+                WHERE id = NEW.showcase_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER showcase_ratings_refresh
+        AFTER INSERT OR DELETE OR UPDATE OF stars, showcase_id ON showcase_ratings
+        FOR EACH ROW EXECUTE FUNCTION showcase_rating_refresh()
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION developer_rating_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE developer_profiles
+                SET rating = COALESCE(
+                    (SELECT avg(stars) FROM developer_ratings WHERE developer_id = OLD.developer_id), 0)
+                WHERE id = OLD.developer_id;
+            END IF;
+            IF TG_OP = 'INSERT' OR NEW.developer_id IS DISTINCT FROM OLD.developer_id THEN
+                UPDATE developer_profiles
+                SET rating = COALESCE(
+                    (SELECT avg(stars) FROM developer_ratings WHERE developer_id = NEW.developer_id), 0)
+                WHERE id = NEW.developer_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER developer_ratings_refresh
+        AFTER INSERT OR DELETE OR UPDATE OF stars, developer_id ON developer_ratings
+        FOR EACH ROW EXECUTE FUNCTION developer_rating_refresh()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER developer_ratings_refresh ON developer_ratings")
+    op.execute("DROP FUNCTION developer_rating_refresh()")
+    op.execute("DROP TRIGGER showcase_ratings_refresh ON showcase_ratings")
+    op.execute("DROP FUNCTION showcase_rating_refresh()")
+    op.alter_column('developer_profiles', 'rating', existing_type=sa.Float(), nullable=True, server_default=None)
+    op.alter_column('showcases', 'total_ratings', existing_type=sa.Integer(), nullable=True, server_default=None)
+    op.alter_column('showcases', 'average_rating', existing_type=sa.Float(), nullable=True, server_default=None)
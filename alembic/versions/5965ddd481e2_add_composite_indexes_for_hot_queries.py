@@ -0,0 +1,39 @@
+"""add composite indexes for hot queries
+
+Revision ID: 5965ddd481e2
+Revises: 55d8056a7cd8
+Create Date: 2026-10-18 01:31:09.466554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5965ddd481e2'
+down_revision: Union[str, None] = '55d8056a7cd8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_conversations_request_status', 'conversations', ['request_id', 'status'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_conversations_request_id', table_name='conversations', postgresql_concurrently=True)
+        op.create_index('ix_conversation_messages_conversation_created', 'conversation_messages', ['conversation_id', 'created_at'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_conversation_messages_conversation_id', table_name='conversation_messages', postgresql_concurrently=True)
+        op.create_index('ix_request_shares_shared_with', 'request_shares', ['shared_with_user_id'], unique=False, postgresql_include=['request_id', 'viewed_at', 'created_at'], postgresql_concurrently=True)
+        op.create_index('ix_snagged_requests_active_developer', 'snagged_requests', ['developer_id'], unique=False, postgresql_where=sa.text('is_active'), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_snagged_requests_active_developer', table_name='snagged_requests', postgresql_concurrently=True)
+        op.drop_index('ix_request_shares_shared_with', table_name='request_shares', postgresql_concurrently=True)
+        op.create_index('ix_conversation_messages_conversation_id', 'conversation_messages', ['conversation_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_conversation_messages_conversation_created', table_name='conversation_messages', postgresql_concurrently=True)
+        op.create_index('ix_conversations_request_id', 'conversations', ['request_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_conversations_request_status', table_name='conversations', postgresql_concurrently=True)
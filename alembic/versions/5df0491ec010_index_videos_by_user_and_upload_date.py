@@ -0,0 +1,32 @@
+"""index videos by user and upload date
+
+Revision ID: 5df0491ec010
+Revises: 22212a261006
+Create Date: 2026-10-18 02:49:38.210583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5df0491ec010'
+down_revision: Union[str, None] = '22212a261006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_videos_user_upload_date', 'videos', ['user_id', sa.text('upload_date DESC')], unique=False, postgresql_concurrently=True)
+        # The composite index's leading column covers user_id lookups
+        op.drop_index('ix_videos_user_id', table_name='videos', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_videos_user_id', 'videos', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_videos_user_upload_date', table_name='videos', postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""move scalar defaults to the server
+
+Revision ID: 620fc5e05c7e
+Revises: 8bd2d7b52039
+Create Date: 2026-10-18 02:29:19.017517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '620fc5e05c7e'
+down_revision: Union[str, None] = '8bd2d7b52039'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DEFAULTS = [
+    ('playlist_videos', 'order', sa.Integer(), '0'),
+    ('developer_profiles', 'total_projects', sa.Integer(), '0'),
+    ('developer_profiles', 'success_rate', sa.Float(), '0'),
+    ('collaboration_sessions', 'status', sa.String(length=20), 'open'),
+    ('collaboration_sessions', 'created_at', sa.DateTime(timezone=True), sa.text('now()')),
+    ('collaboration_messages', 'message_type', sa.String(length=50), 'text'),
+    ('collaboration_messages', 'created_at', sa.DateTime(timezone=True), sa.text('now()')),
+    ('collaboration_attachments', 'created_at', sa.DateTime(timezone=True), sa.text('now()')),
+]
+
+
+def upgrade() -> None:
+    for table, column, type_, default in DEFAULTS:
+        op.alter_column(table, column, existing_type=type_, server_default=default)
+
+
+def downgrade() -> None:
+    for table, column, type_, _ in DEFAULTS:
+        op.alter_column(table, column, existing_type=type_, server_default=None)
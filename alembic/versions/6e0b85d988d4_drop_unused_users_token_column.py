@@ -0,0 +1,26 @@
+"""drop unused users token column
+
+Revision ID: 6e0b85d988d4
+Revises: b177190228da
+Create Date: 2026-10-18 01:59:59.231580
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e0b85d988d4'
+down_revision: Union[str, None] = 'b177190228da'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_column('users', 'token')
+
+
+def downgrade() -> None:
+    op.add_column('users', sa.Column('token', sa.VARCHAR(), autoincrement=False, nullable=True))
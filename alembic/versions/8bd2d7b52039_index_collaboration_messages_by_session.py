@@ -0,0 +1,29 @@
+"""index collaboration messages by session
+
+Revision ID: 8bd2d7b52039
+Revises: 4f07b07fce52
+Create Date: 2026-10-18 02:27:34.889791
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8bd2d7b52039'
+down_revision: Union[str, None] = '4f07b07fce52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_collaboration_messages_session_created', 'collaboration_messages', ['session_id', 'created_at'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_collaboration_messages_session_created', table_name='collaboration_messages', postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""drop redundant video title and developer rating indexes
+
+Revision ID: 8e9496f057a7
+Revises: 620fc5e05c7e
+Create Date: 2026-10-18 02:31:06.192795
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e9496f057a7'
+down_revision: Union[str, None] = '620fc5e05c7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # DROP INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_videos_title', table_name='videos', postgresql_concurrently=True)
+        op.drop_index('ix_developer_ratings_developer_id', table_name='developer_ratings', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_developer_ratings_developer_id', 'developer_ratings', ['developer_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_videos_title', 'videos', ['title'], unique=False, postgresql_concurrently=True)
@@ -0,0 +1,46 @@
+"""store user type and request and conversation status as checked varchar
+
+Revision ID: 9752d018cf7a
+Revises: d09ec2eeb307
+Create Date: 2026-10-18 01:40:56.115879
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9752d018cf7a'
+down_revision: Union[str, None] = 'd09ec2eeb307'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, constraint, native enum type, allowed values)
+CHECKED_COLUMNS = [
+    ('users', 'user_type', 'check_user_type', 'usertype', ['client', 'developer']),
+    ('requests', 'status', 'check_request_status', 'requeststatus', ['open', 'in_progress', 'completed', 'cancelled']),
+    ('conversations', 'status', 'check_conversation_status', 'conversationstatus', ['active', 'negotiating', 'agreed', 'completed']),
+]
+
+
+def _in_list(column, values):
+    return f"{column} IN ({', '.join(repr(v) for v in values)})"
+
+
+def upgrade() -> None:
+    for table, column, constraint, enum_name, values in CHECKED_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(length=32), postgresql_using=f'{column}::text')
+        op.create_check_constraint(constraint, table, _in_list(column, values))
+        postgresql.ENUM(name=enum_name).drop(op.get_bind())
+
+
+def downgrade() -> None:
+    for table, column, constraint, enum_name, values in reversed(CHECKED_COLUMNS):
+        enum_type = postgresql.ENUM(*values, name=enum_name)
+        enum_type.create(op.get_bind())
+        op.drop_constraint(constraint, table, type_='check')
+        op.alter_column(table, column, type_=enum_type, postgresql_using=f'{column}::{enum_name}')
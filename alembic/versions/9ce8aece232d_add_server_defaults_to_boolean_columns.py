@@ -0,0 +1,48 @@
+"""add server defaults to boolean columns
+
+Revision ID: 9ce8aece232d
+Revises: d4a263996e97
+Create Date: 2026-10-18 02:05:59.326141
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9ce8aece232d'
+down_revision: Union[str, None] = 'd4a263996e97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, default)
+BOOLEAN_DEFAULTS = [
+    ('users', 'is_active', 'true'),
+    ('users', 'terms_accepted', 'false'),
+    ('users', 'needs_role_selection', 'true'),
+    ('video_playlists', 'is_public', 'true'),
+    ('videos', 'is_public', 'false'),
+    ('developer_profiles', 'is_public', 'false'),
+    ('projects', 'is_active', 'true'),
+    ('requests', 'is_public', 'false'),
+    ('requests', 'contains_sensitive_data', 'false'),
+    ('requests', 'is_idea', 'false'),
+    ('requests', 'seeks_collaboration', 'false'),
+    ('request_shares', 'can_edit', 'false'),
+    ('conversations', 'is_external', 'false'),
+    ('snagged_requests', 'is_active', 'true'),
+    ('collaboration_messages', 'is_system', 'false'),
+]
+
+
+def upgrade() -> None:
+    for table, column, default in BOOLEAN_DEFAULTS:
+        op.alter_column(table, column, existing_type=sa.Boolean(), server_default=sa.text(default))
+
+
+def downgrade() -> None:
+    for table, column, default in reversed(BOOLEAN_DEFAULTS):
+        op.alter_column(table, column, existing_type=sa.Boolean(), server_default=None)
@@ -0,0 +1,45 @@
+"""allow one active snag per developer and request
+
+Revision ID: a256dae69c81
+Revises: 382bb6b0dcc8
+Create Date: 2026-10-18 02:13:08.202594
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a256dae69c81'
+down_revision: Union[str, None] = '382bb6b0dcc8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest of any duplicate active snags; the rest become
+    # inactive history like a removed snag
+    op.execute(
+        """
+        UPDATE snagged_requests s SET is_active = false
+        WHERE s.is_active AND EXISTS (
+            SELECT 1 FROM snagged_requests o
+            WHERE o.is_active
+              AND o.developer_id = s.developer_id
+              AND o.request_id = s.request_id
+              AND o.id < s.id
+        )
+        """
+    )
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_snagged_requests_active_developer_request', 'snagged_requests', ['developer_id', 'request_id'], unique=True, postgresql_where=sa.text('is_active'), postgresql_concurrently=True)
+        op.drop_index('ix_snagged_requests_active_developer', table_name='snagged_requests', postgresql_where=sa.text('is_active'), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_snagged_requests_active_developer', 'snagged_requests', ['developer_id'], unique=False, postgresql_where=sa.text('is_active'), postgresql_concurrently=True)
+        op.drop_index('ix_snagged_requests_active_developer_request', table_name='snagged_requests', postgresql_where=sa.text('is_active'), postgresql_concurrently=True)
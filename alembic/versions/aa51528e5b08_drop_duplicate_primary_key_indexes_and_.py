@@ -0,0 +1,79 @@
+"""drop duplicate primary key indexes and use partial share token indexes
+
+Revision ID: aa51528e5b08
+Revises: 54a76eb6e83e
+Create Date: 2026-10-18 01:36:06.589142
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'aa51528e5b08'
+down_revision: Union[str, None] = '54a76eb6e83e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables whose "id" primary key also carried a plain ix_<table>_id index
+# duplicating the primary key's own unique btree.
+PK_INDEXED_TABLES = [
+    'client_profiles',
+    'collaboration_attachments',
+    'collaboration_messages',
+    'collaboration_participants',
+    'collaboration_sessions',
+    'conversation_content_links',
+    'conversation_messages',
+    'conversations',
+    'developer_profiles',
+    'donations',
+    'feedbacks',
+    'oauth_connections',
+    'projects',
+    'request_comments',
+    'request_shares',
+    'requests',
+    'showcase_content_links',
+    'showcase_ratings',
+    'showcases',
+    'snagged_requests',
+    'subscriptions',
+    'user_tokens',
+    'users',
+    'video_playlists',
+    'video_ratings',
+    'videos',
+]
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        for table in PK_INDEXED_TABLES:
+            op.drop_index(f'ix_{table}_id', table_name=table, postgresql_concurrently=True)
+
+        op.drop_index('ix_videos_share_token', table_name='videos', postgresql_concurrently=True)
+        op.create_index('ix_videos_share_token', 'videos', ['share_token'], unique=True, postgresql_where=sa.text('share_token IS NOT NULL'), postgresql_concurrently=True)
+        op.create_index('ix_showcases_share_token', 'showcases', ['share_token'], unique=True, postgresql_where=sa.text('share_token IS NOT NULL'), postgresql_concurrently=True)
+        op.create_index('ix_video_playlists_share_token', 'video_playlists', ['share_token'], unique=True, postgresql_where=sa.text('share_token IS NOT NULL'), postgresql_concurrently=True)
+
+    op.drop_constraint('showcases_share_token_key', 'showcases', type_='unique')
+    op.drop_constraint('video_playlists_share_token_key', 'video_playlists', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('video_playlists_share_token_key', 'video_playlists', ['share_token'])
+    op.create_unique_constraint('showcases_share_token_key', 'showcases', ['share_token'])
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_video_playlists_share_token', table_name='video_playlists', postgresql_concurrently=True)
+        op.drop_index('ix_showcases_share_token', table_name='showcases', postgresql_concurrently=True)
+        op.drop_index('ix_videos_share_token', table_name='videos', postgresql_concurrently=True)
+        op.create_index('ix_videos_share_token', 'videos', ['share_token'], unique=True, postgresql_concurrently=True)
+
+        for table in PK_INDEXED_TABLES:
+            op.create_index(f'ix_{table}_id', table, ['id'], unique=False, postgresql_concurrently=True)
@@ -0,0 +1,175 @@
+"""denormalize showcase linked content
+
+Revision ID: ac3046b8b346
+Revises: 4fa397eab3e6
+Create Date: 2026-10-18 01:55:25.430755
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ac3046b8b346'
+down_revision: Union[str, None] = '4fa397eab3e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'showcases',
+        sa.Column('linked_content_cache', postgresql.JSONB(astext_type=sa.Text()), server_default='[]', nullable=False),
+    )
+    op.create_index('ix_showcase_content_links_content_id', 'showcase_content_links', ['content_id'], unique=False)
+
+    # Renders the list ProjectShowcase.linked_content returns, in link order
+    op.execute(
+        """
+        CREATE FUNCTION showcase_linked_content(sid integer) RETURNS jsonb AS $$
+            SELECT COALESCE(jsonb_agg(item ORDER BY link_id), '[]'::jsonb)
+            FROM (
+                SELECT l.id AS link_id,
+                    CASE l.content_type
+                        WHEN 'video' THEN (
+                            SELECT jsonb_build_object(
+                                'id', l.id, 'type', 'video', 'content_id', v.id,
+                                'title', v.title, 'thumbnail_url', v.thumbnail_path)
+                            FROM videos v WHERE v.id = l.content_id)
+                        WHEN 'profile' THEN (
+                            SELECT jsonb_build_object(
+                                'id', l.id, 'type', 'profile', 'content_id', l.content_id,
+                                'developer_name', u.username,
+                                'profile_image_url', p.profile_image_url)
+                            FROM developer_profiles p JOIN users u ON u.id = p.user_id
+                            WHERE p.user_id = l.content_id)
+                    END AS item
+                FROM showcase_content_links l
+                WHERE l.showcase_id = sid
+            ) links
+            WHERE item IS NOT NULL
+        $$ LANGUAGE sql STABLE
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION refresh_linked_content(link_type contentlinktype, target_id integer)
+        RETURNS void AS $$
+            UPDATE showcases SET linked_content_cache = showcase_linked_content(id)
+            WHERE id IN (
+                SELECT showcase_id FROM showcase_content_links
+                WHERE content_type = link_type AND content_id = target_id
+            )
+        $$ LANGUAGE sql
+        """
+    )
+
+    op.execute(
+        """
+        CREATE FUNCTION showcase_content_link_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                UPDATE showcases SET linked_content_cache = showcase_linked_content(id)
+                WHERE id = OLD.showcase_id;
+            END IF;
+            IF TG_OP = 'INSERT' OR NEW.showcase_id IS DISTINCT FROM OLD.showcase_id THEN
+                UPDATE showcases SET linked_content_cache = showcase_linked_content(id)
+                WHERE id = NEW.showcase_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER showcase_content_links_refresh
+        AFTER INSERT OR DELETE OR UPDATE ON showcase_content_links
+        FOR EACH ROW EXECUTE FUNCTION showcase_content_link_refresh()
+        """
+    )
+
+    # The cached entries copy video, profile and username fields, so edits
+    # to those rows re-render every showcase that links to them
+    op.execute(
+        """
+        CREATE FUNCTION video_linked_content_refresh() RETURNS trigger AS $$
+        BEGIN
+            PERFORM refresh_linked_content('video', OLD.id);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER videos_linked_content_refresh
+        AFTER DELETE OR UPDATE OF title, thumbnail_path ON videos
+        FOR EACH ROW EXECUTE FUNCTION video_linked_content_refresh()
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION profile_linked_content_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                PERFORM refresh_linked_content('profile', OLD.user_id);
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                PERFORM refresh_linked_content('profile', NEW.user_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER developer_profiles_linked_content_refresh
+        AFTER INSERT OR DELETE OR UPDATE OF profile_image_url, user_id ON developer_profiles
+        FOR EACH ROW EXECUTE FUNCTION profile_linked_content_refresh()
+        """
+    )
+    op.execute(
+        """
+        CREATE FUNCTION user_linked_content_refresh() RETURNS trigger AS $$
+        BEGIN
+            PERFORM refresh_linked_content('profile', NEW.id);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER users_linked_content_refresh
+        AFTER UPDATE OF username ON users
+        FOR EACH ROW EXECUTE FUNCTION user_linked_content_refresh()
+        """
+    )
+
+    # Backfill every showcase that already has links in one statement
+    op.execute(
+        """
+        UPDATE showcases SET linked_content_cache = showcase_linked_content(id)
+        WHERE id IN (SELECT DISTINCT showcase_id FROM showcase_content_links)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER users_linked_content_refresh ON users")
+    op.execute("DROP FUNCTION user_linked_content_refresh()")
+    op.execute("DROP TRIGGER developer_profiles_linked_content_refresh ON developer_profiles")
+    op.execute("DROP FUNCTION profile_linked_content_refresh()")
+    op.execute("DROP TRIGGER videos_linked_content_refresh ON videos")
+    op.execute("DROP FUNCTION video_linked_content_refresh()")
+    op.execute("DROP TRIGGER showcase_content_links_refresh ON showcase_content_links")
+    op.execute("DROP FUNCTION showcase_content_link_refresh()")
+    op.execute("DROP FUNCTION refresh_linked_content(contentlinktype, integer)")
+    op.execute("DROP FUNCTION showcase_linked_content(integer)")
+    op.drop_index('ix_showcase_content_links_content_id', table_name='showcase_content_links')
+    op.drop_column('showcases', 'linked_content_cache')
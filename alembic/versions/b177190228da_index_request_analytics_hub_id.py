@@ -0,0 +1,29 @@
+"""index request analytics hub id
+
+Revision ID: b177190228da
+Revises: e46ade43b8ac
+Create Date: 2026-10-18 01:58:33.090963
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b177190228da'
+down_revision: Union[str, None] = 'e46ade43b8ac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_requests_analytics_hub_id', 'requests', [sa.text("(external_metadata ->> 'analytics_hub_id')")], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_requests_analytics_hub_id', table_name='requests', postgresql_concurrently=True)
@@ -0,0 +1,34 @@
+"""check collaboration session status
+
+Revision ID: b90675c30367
+Revises: c2548f3c32ac
+Create Date: 2026-10-18 02:34:20.337992
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b90675c30367'
+down_revision: Union[str, None] = 'c2548f3c32ac'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SESSION_STATUSES = ['open', 'in_progress', 'resolved']
+
+
+def upgrade() -> None:
+    op.alter_column('collaboration_sessions', 'status', existing_type=sa.String(length=20), type_=sa.String(length=32), existing_nullable=False)
+    op.create_check_constraint(
+        'check_collaboration_session_status', 'collaboration_sessions',
+        f"status IN ({', '.join(repr(v) for v in SESSION_STATUSES)})"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('check_collaboration_session_status', 'collaboration_sessions', type_='check')
+    op.alter_column('collaboration_sessions', 'status', existing_type=sa.String(length=32), type_=sa.String(length=20), existing_nullable=False)
@@ -0,0 +1,29 @@
+"""unique partial index on users stripe customer
+
+Revision ID: c2548f3c32ac
+Revises: 8e9496f057a7
+Create Date: 2026-10-18 02:32:16.970184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2548f3c32ac'
+down_revision: Union[str, None] = '8e9496f057a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_stripe_customer_id', 'users', ['stripe_customer_id'], unique=True, postgresql_where=sa.text('stripe_customer_id IS NOT NULL'), postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_stripe_customer_id', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,74 @@
+"""store developer skills as an array with a gin index
+
+Revision ID: d09ec2eeb307
+Revises: aa51528e5b08
+Create Date: 2026-10-18 01:39:21.372832
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd09ec2eeb307'
+down_revision: Union[str, None] = 'aa51528e5b08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Split the comma-separated text into trimmed, non-empty elements
+    op.alter_column(
+        'developer_profiles',
+        'skills',
+        type_=postgresql.ARRAY(sa.String()),
+        postgresql_using="array_remove(regexp_split_to_array(btrim(coalesce(skills, '')), '\\s*,\\s*'), '')",
+        server_default='{}',
+        nullable=False,
+    )
+
+    # Lowercased copy for case-insensitive search; skills keeps the user's casing
+    op.add_column(
+        'developer_profiles',
+        sa.Column('skills_normalized', postgresql.ARRAY(sa.String()), server_default='{}', nullable=False),
+    )
+    op.execute(
+        """
+        CREATE FUNCTION developer_skills_normalize() RETURNS trigger AS $$
+        BEGIN
+            NEW.skills_normalized := ARRAY(SELECT lower(s) FROM unnest(NEW.skills) AS s);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER developer_profiles_skills_normalize
+        BEFORE INSERT OR UPDATE OF skills ON developer_profiles
+        FOR EACH ROW EXECUTE FUNCTION developer_skills_normalize()
+        """
+    )
+    op.execute("UPDATE developer_profiles SET skills_normalized = ARRAY(SELECT lower(s) FROM unnest(skills) AS s)")
+
+    with op.get_context().autocommit_block():
+        op.create_index('ix_developer_profiles_skills_normalized', 'developer_profiles', ['skills_normalized'], unique=False, postgresql_using='gin', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_developer_profiles_skills_normalized', table_name='developer_profiles', postgresql_using='gin', postgresql_concurrently=True)
+    op.execute("DROP TRIGGER developer_profiles_skills_normalize ON developer_profiles")
+    op.execute("DROP FUNCTION developer_skills_normalize()")
+    op.drop_column('developer_profiles', 'skills_normalized')
+    op.alter_column(
+        'developer_profiles',
+        'skills',
+        type_=sa.String(),
+        postgresql_using="array_to_string(skills, ', ')",
+        server_default=None,
+        nullable=True,
+    )
@@ -0,0 +1,280 @@
+"""replace polymorphic showcase content link target with foreign keys
+
+Revision ID: d4a263996e97
+Revises: 6e0b85d988d4
+Create Date: 2026-10-18 02:03:35.226823
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a263996e97'
+down_revision: Union[str, None] = '6e0b85d988d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# linked_content_cache rendering from ac3046b8b346, rewritten against the
+# new foreign keys; downgrade restores the content_type/content_id versions
+LINKED_CONTENT_SQL = """
+    CREATE OR REPLACE FUNCTION showcase_linked_content(sid integer) RETURNS jsonb AS $$
+        SELECT COALESCE(jsonb_agg(item ORDER BY link_id), '[]'::jsonb)
+        FROM (
+            SELECT l.id AS link_id,
+                CASE
+                    WHEN l.video_id IS NOT NULL THEN (
+                        SELECT jsonb_build_object(
+                            'id', l.id, 'type', 'video', 'content_id', v.id,
+                            'title', v.title, 'thumbnail_url', v.thumbnail_path)
+                        FROM videos v WHERE v.id = l.video_id)
+                    ELSE (
+                        SELECT jsonb_build_object(
+                            'id', l.id, 'type', 'profile', 'content_id', l.profile_user_id,
+                            'developer_name', u.username,
+                            'profile_image_url', p.profile_image_url)
+                        FROM developer_profiles p JOIN users u ON u.id = p.user_id
+                        WHERE p.user_id = l.profile_user_id)
+                END AS item
+            FROM showcase_content_links l
+            WHERE l.showcase_id = sid
+        ) links
+        WHERE item IS NOT NULL
+    $$ LANGUAGE sql STABLE
+"""
+VIDEO_REFRESH_SQL = """
+    CREATE FUNCTION video_linked_content_refresh() RETURNS trigger AS $$
+    BEGIN
+        UPDATE showcases SET linked_content_cache = showcase_linked_content(id)
+        WHERE id IN (
+            SELECT showcase_id FROM showcase_content_links WHERE video_id = NEW.id
+        );
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+PROFILE_REFRESH_SQL = """
+    CREATE FUNCTION profile_linked_content_refresh() RETURNS trigger AS $$
+    BEGIN
+        UPDATE showcases SET linked_content_cache = showcase_linked_content(id)
+        WHERE id IN (
+            SELECT showcase_id FROM showcase_content_links
+            WHERE profile_user_id IN (OLD.user_id, NEW.user_id)
+        );
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+USER_REFRESH_SQL = """
+    CREATE FUNCTION user_linked_content_refresh() RETURNS trigger AS $$
+    BEGIN
+        UPDATE showcases SET linked_content_cache = showcase_linked_content(id)
+        WHERE id IN (
+            SELECT showcase_id FROM showcase_content_links WHERE profile_user_id = NEW.id
+        );
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+OLD_LINKED_CONTENT_SQL = """
+    CREATE OR REPLACE FUNCTION showcase_linked_content(sid integer) RETURNS jsonb AS $$
+        SELECT COALESCE(jsonb_agg(item ORDER BY link_id), '[]'::jsonb)
+        FROM (
+            SELECT l.id AS link_id,
+                CASE l.content_type
+                    WHEN 'video' THEN (
+                        SELECT jsonb_build_object(
+                            'id', l.id, 'type', 'video', 'content_id', v.id,
+                            'title', v.title, 'thumbnail_url', v.thumbnail_path)
+                        FROM videos v WHERE v.id = l.content_id)
+                    WHEN 'profile' THEN (
+                        SELECT jsonb_build_object(
+                            'id', l.id, 'type', 'profile', 'content_id', l.content_id,
+                            'developer_name', u.username,
+                            'profile_image_url', p.profile_image_url)
+                        FROM developer_profiles p JOIN users u ON u.id = p.user_id
+                        WHERE p.user_id = l.content_id)
+                END AS item
+            FROM showcase_content_links l
+            WHERE l.showcase_id = sid
+        ) links
+        WHERE item IS NOT NULL
+    $$ LANGUAGE sql STABLE
+"""
+OLD_REFRESH_HELPER_SQL = """
+    CREATE FUNCTION refresh_linked_content(link_type contentlinktype, target_id integer)
+    RETURNS void AS $$
+        UPDATE showcases SET linked_content_cache = showcase_linked_content(id)
+        WHERE id IN (
+            SELECT showcase_id FROM showcase_content_links
+            WHERE content_type = link_type AND content_id = target_id
+        )
+    $$ LANGUAGE sql
+"""
+OLD_VIDEO_REFRESH_SQL = """
+    CREATE FUNCTION video_linked_content_refresh() RETURNS trigger AS $$
+    BEGIN
+        PERFORM refresh_linked_content('video', OLD.id);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+OLD_PROFILE_REFRESH_SQL = """
+    CREATE FUNCTION profile_linked_content_refresh() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP <> 'INSERT' THEN
+            PERFORM refresh_linked_content('profile', OLD.user_id);
+        END IF;
+        IF TG_OP <> 'DELETE' THEN
+            PERFORM refresh_linked_content('profile', NEW.user_id);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+OLD_USER_REFRESH_SQL = """
+    CREATE FUNCTION user_linked_content_refresh() RETURNS trigger AS $$
+    BEGIN
+        PERFORM refresh_linked_content('profile', NEW.id);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+def _drop_refresh_triggers():
+    op.execute("DROP TRIGGER users_linked_content_refresh ON users")
+    op.execute("DROP FUNCTION user_linked_content_refresh()")
+    op.execute("DROP TRIGGER developer_profiles_linked_content_refresh ON developer_profiles")
+    op.execute("DROP FUNCTION profile_linked_content_refresh()")
+    op.execute("DROP TRIGGER videos_linked_content_refresh ON videos")
+    op.execute("DROP FUNCTION video_linked_content_refresh()")
+
+
+def upgrade() -> None:
+    op.add_column('showcase_content_links', sa.Column('video_id', sa.Integer(), nullable=True))
+    op.add_column('showcase_content_links', sa.Column('profile_user_id', sa.Integer(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE showcase_content_links l SET video_id = l.content_id
+        FROM videos v
+        WHERE l.content_type = 'video' AND v.id = l.content_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE showcase_content_links l SET profile_user_id = l.content_id
+        FROM users u
+        WHERE l.content_type = 'profile' AND u.id = l.content_id
+        """
+    )
+    # Links whose video/user is already gone were only ever skipped on read
+    op.execute(
+        "DELETE FROM showcase_content_links "
+        "WHERE video_id IS NULL AND profile_user_id IS NULL"
+    )
+
+    op.create_foreign_key('showcase_content_links_video_id_fkey', 'showcase_content_links', 'videos', ['video_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('showcase_content_links_profile_user_id_fkey', 'showcase_content_links', 'users', ['profile_user_id'], ['id'], ondelete='CASCADE')
+    op.create_index('ix_showcase_content_links_video_id', 'showcase_content_links', ['video_id'], unique=False)
+    op.create_index('ix_showcase_content_links_profile_user_id', 'showcase_content_links', ['profile_user_id'], unique=False)
+    op.create_check_constraint(
+        'check_showcase_link_target',
+        'showcase_content_links',
+        '(video_id IS NOT NULL)::int + (profile_user_id IS NOT NULL)::int = 1',
+    )
+
+    # Deleted videos and users now remove their links by cascade, which the
+    # showcase_content_links_refresh trigger already handles
+    _drop_refresh_triggers()
+    op.execute("DROP FUNCTION refresh_linked_content(contentlinktype, integer)")
+    op.execute(LINKED_CONTENT_SQL)
+    op.execute(VIDEO_REFRESH_SQL)
+    op.execute(
+        """
+        CREATE TRIGGER videos_linked_content_refresh
+        AFTER UPDATE OF title, thumbnail_path ON videos
+        FOR EACH ROW EXECUTE FUNCTION video_linked_content_refresh()
+        """
+    )
+    op.execute(PROFILE_REFRESH_SQL)
+    op.execute(
+        """
+        CREATE TRIGGER developer_profiles_linked_content_refresh
+        AFTER INSERT OR DELETE OR UPDATE OF profile_image_url, user_id ON developer_profiles
+        FOR EACH ROW EXECUTE FUNCTION profile_linked_content_refresh()
+        """
+    )
+    op.execute(USER_REFRESH_SQL)
+    op.execute(
+        """
+        CREATE TRIGGER users_linked_content_refresh
+        AFTER UPDATE OF username ON users
+        FOR EACH ROW EXECUTE FUNCTION user_linked_content_refresh()
+        """
+    )
+
+    op.drop_index('ix_showcase_content_links_content_id', table_name='showcase_content_links')
+    op.drop_column('showcase_content_links', 'content_type')
+    op.drop_column('showcase_content_links', 'content_id')
+    postgresql.ENUM(name='contentlinktype').drop(op.get_bind())
+
+
+def downgrade() -> None:
+    content_link_type = postgresql.ENUM('video', 'profile', name='contentlinktype')
+    content_link_type.create(op.get_bind())
+    op.add_column('showcase_content_links', sa.Column('content_type', content_link_type, nullable=True))
+    op.add_column('showcase_content_links', sa.Column('content_id', sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE showcase_content_links SET
+            content_type = CASE WHEN video_id IS NOT NULL
+                THEN 'video' ELSE 'profile' END::contentlinktype,
+            content_id = COALESCE(video_id, profile_user_id)
+        """
+    )
+    op.alter_column('showcase_content_links', 'content_type', nullable=False)
+    op.alter_column('showcase_content_links', 'content_id', nullable=False)
+    op.create_index('ix_showcase_content_links_content_id', 'showcase_content_links', ['content_id'], unique=False)
+
+    _drop_refresh_triggers()
+    op.execute(OLD_LINKED_CONTENT_SQL)
+    op.execute(OLD_REFRESH_HELPER_SQL)
+    op.execute(OLD_VIDEO_REFRESH_SQL)
+    op.execute(
+        """
+        CREATE TRIGGER videos_linked_content_refresh
+        AFTER DELETE OR UPDATE OF title, thumbnail_path ON videos
+        FOR EACH ROW EXECUTE FUNCTION video_linked_content_refresh()
+        """
+    )
+    op.execute(OLD_PROFILE_REFRESH_SQL)
+    op.execute(
+        """
+        CREATE TRIGGER developer_profiles_linked_content_refresh
+        AFTER INSERT OR DELETE OR UPDATE OF profile_image_url, user_id ON developer_profiles
+        FOR EACH ROW EXECUTE FUNCTION profile_linked_content_refresh()
+        """
+    )
+    op.execute(OLD_USER_REFRESH_SQL)
+    op.execute(
+        """
+        CREATE TRIGGER users_linked_content_refresh
+        AFTER UPDATE OF username ON users
+        FOR EACH ROW EXECUTE FUNCTION user_linked_content_refresh()
+        """
+    )
+
+    op.drop_constraint('check_showcase_link_target', 'showcase_content_links', type_='check')
+    op.drop_index('ix_showcase_content_links_profile_user_id', table_name='showcase_content_links')
+    op.drop_index('ix_showcase_content_links_video_id', table_name='showcase_content_links')
+    op.drop_constraint('showcase_content_links_profile_user_id_fkey', 'showcase_content_links', type_='foreignkey')
+    op.drop_constraint('showcase_content_links_video_id_fkey', 'showcase_content_links', type_='foreignkey')
+    op.drop_column('showcase_content_links', 'profile_user_id')
+    op.drop_column('showcase_content_links', 'video_id')
@@ -0,0 +1,87 @@
+"""replace polymorphic conversation content link target with foreign keys
+
+Revision ID: d9e80bb1c355
+Revises: 3eae9f61dbbe
+Create Date: 2026-10-18 01:46:24.726159
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9e80bb1c355'
+down_revision: Union[str, None] = '3eae9f61dbbe'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('conversation_content_links', sa.Column('video_id', sa.Integer(), nullable=True))
+    op.add_column('conversation_content_links', sa.Column('profile_user_id', sa.Integer(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE conversation_content_links l SET video_id = l.content_id
+        FROM videos v
+        WHERE l.content_type = 'video' AND v.id = l.content_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE conversation_content_links l SET profile_user_id = l.content_id
+        FROM users u
+        WHERE l.content_type = 'profile' AND u.id = l.content_id
+        """
+    )
+    # Links whose video/user is already gone were only ever skipped on read
+    op.execute(
+        "DELETE FROM conversation_content_links "
+        "WHERE video_id IS NULL AND profile_user_id IS NULL"
+    )
+
+    op.create_foreign_key('conversation_content_links_video_id_fkey', 'conversation_content_links', 'videos', ['video_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('conversation_content_links_profile_user_id_fkey', 'conversation_content_links', 'users', ['profile_user_id'], ['id'], ondelete='CASCADE')
+    op.create_index('ix_conversation_content_links_video_id', 'conversation_content_links', ['video_id'], unique=False)
+    op.create_index('ix_conversation_content_links_profile_user_id', 'conversation_content_links', ['profile_user_id'], unique=False)
+    op.create_check_constraint(
+        'check_conversation_link_target',
+        'conversation_content_links',
+        '(video_id IS NOT NULL)::int + (profile_user_id IS NOT NULL)::int = 1',
+    )
+    op.create_unique_constraint('unique_conversation_video_link', 'conversation_content_links', ['message_id', 'video_id'])
+    op.create_unique_constraint('unique_conversation_profile_link', 'conversation_content_links', ['message_id', 'profile_user_id'])
+
+    op.drop_constraint('unique_content_link', 'conversation_content_links', type_='unique')
+    op.drop_column('conversation_content_links', 'content_type')
+    op.drop_column('conversation_content_links', 'content_id')
+
+
+def downgrade() -> None:
+    content_link_type = postgresql.ENUM('video', 'profile', name='contentlinktype', create_type=False)
+    op.add_column('conversation_content_links', sa.Column('content_type', content_link_type, nullable=True))
+    op.add_column('conversation_content_links', sa.Column('content_id', sa.Integer(), nullable=True))
+    op.execute(
+        """
+        UPDATE conversation_content_links SET
+            content_type = CASE WHEN video_id IS NOT NULL
+                THEN 'video' ELSE 'profile' END::contentlinktype,
+            content_id = COALESCE(video_id, profile_user_id)
+        """
+    )
+    op.alter_column('conversation_content_links', 'content_type', nullable=False)
+    op.alter_column('conversation_content_links', 'content_id', nullable=False)
+    op.create_unique_constraint('unique_content_link', 'conversation_content_links', ['message_id', 'content_type', 'content_id'])
+
+    op.drop_constraint('unique_conversation_profile_link', 'conversation_content_links', type_='unique')
+    op.drop_constraint('unique_conversation_video_link', 'conversation_content_links', type_='unique')
+    op.drop_constraint('check_conversation_link_target', 'conversation_content_links', type_='check')
+    op.drop_index('ix_conversation_content_links_profile_user_id', table_name='conversation_content_links')
+    op.drop_index('ix_conversation_content_links_video_id', table_name='conversation_content_links')
+    op.drop_constraint('conversation_content_links_profile_user_id_fkey', 'conversation_content_links', type_='foreignkey')
+    op.drop_constraint('conversation_content_links_video_id_fkey', 'conversation_content_links', type_='foreignkey')
+    op.drop_column('conversation_content_links', 'profile_user_id')
+    op.drop_column('conversation_content_links', 'video_id')
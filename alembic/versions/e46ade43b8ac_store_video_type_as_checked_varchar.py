@@ -0,0 +1,37 @@
+"""store video type as checked varchar
+
+Revision ID: e46ade43b8ac
+Revises: ac3046b8b346
+Create Date: 2026-10-18 01:56:59.907347
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e46ade43b8ac'
+down_revision: Union[str, None] = 'ac3046b8b346'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+VIDEO_TYPES = ['project_overview', 'solution_demo', 'progress_update', 'pitch_contest', 'tutorials']
+
+
+def upgrade() -> None:
+    op.alter_column('videos', 'video_type', type_=sa.String(length=32), postgresql_using='video_type::text')
+    op.create_check_constraint(
+        'check_video_type', 'videos', f"video_type IN ({', '.join(repr(v) for v in VIDEO_TYPES)})"
+    )
+    postgresql.ENUM(name='videotype').drop(op.get_bind())
+
+
+def downgrade() -> None:
+    enum_type = postgresql.ENUM(*VIDEO_TYPES, name='videotype')
+    enum_type.create(op.get_bind())
+    op.drop_constraint('check_video_type', 'videos', type_='check')
+    op.alter_column('videos', 'video_type', type_=enum_type, postgresql_using='video_type::videotype')
@@ -0,0 +1,34 @@
+"""index votes by video and narrow comment vote type
+
+Revision ID: ef97078a4b25
+Revises: d9e80bb1c355
+Create Date: 2026-10-18 01:47:59.992000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ef97078a4b25'
+down_revision: Union[str, None] = 'd9e80bb1c355'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_votes_video_id', 'votes', ['video_id'], unique=False, postgresql_concurrently=True)
+
+    op.alter_column('request_comment_votes', 'vote_type', type_=sa.SmallInteger(), existing_nullable=False)
+    op.create_check_constraint('check_comment_vote_type', 'request_comment_votes', 'vote_type BETWEEN -1 AND 1')
+
+
+def downgrade() -> None:
+    op.drop_constraint('check_comment_vote_type', 'request_comment_votes', type_='check')
+    op.alter_column('request_comment_votes', 'vote_type', type_=sa.Integer(), existing_nullable=False)
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_votes_video_id', table_name='votes', postgresql_concurrently=True)
@@ -44,6 +44,17 @@ class Settings(BaseSettings):
     # Add Analytics Hub API settings
     ANALYTICS_HUB_API_URL: Optional[str] = None
     ANALYTICS_HUB_API_KEY: Optional[str] = None
+    # Raise on every lazy load in eager() queries, not just the ones that
+    # would emit SQL. Turn on in dev/staging to catch missing loader options.
+    raiseload_strict: bool = False
+    # Connection pool per worker process
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800
+    # Seconds a request waits for a free connection before failing
+    db_pool_timeout: int = 30
+    # How often each worker refreshes the showcase_leaderboard view
+    leaderboard_refresh_seconds: int = 300
 
     class Config:
         env_file = os.getenv("ENV_FILE", ".env")
@@ -1,9 +1,15 @@
-from datetime import datetime
 import secrets
 from typing import Optional, List, Dict, Any, Union
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, selectinload
 from .. import models
 
+# Messages are rendered with their sender and attached files
+MESSAGE_LOAD_OPTIONS = (
+    joinedload(models.CollaborationMessage.participant),
+    selectinload(models.CollaborationMessage.attachments),
+)
+
 
 # Collaboration Session CRUD
 def create_collaboration_session(
@@ -16,7 +22,7 @@ def create_collaboration_session(
     session = models.CollaborationSession(
         external_ticket_id=external_ticket_id,
         source_system=source_system,
-        status="open",
+        status=models.CollaborationSessionStatus.open,
         metadata=metadata,
         access_token=secrets.token_urlsafe(32),
     )
@@ -32,6 +38,7 @@ def get_collaboration_session(
     """Get a collaboration session by ID"""
     return (
         db.query(models.CollaborationSession)
+        .options(selectinload(models.CollaborationSession.participants))
         .filter(models.CollaborationSession.id == session_id)
         .first()
     )
@@ -46,10 +53,10 @@ def update_session_status(
         return None
 
     session.status = status
-    session.updated_at = datetime.utcnow()
+    session.updated_at = func.now()
 
-    if status == "resolved":
-        session.resolved_at = datetime.utcnow()
+    if status == models.CollaborationSessionStatus.resolved:
+        session.resolved_at = func.now()
 
     db.commit()
     db.refresh(session)
@@ -90,7 +97,7 @@ def create_collaboration_participant(
         user_type=user_type,
         external_user_id=external_user_id,
         notification_settings=notification_settings,
-        last_viewed_at=datetime.utcnow(),
+        last_viewed_at=func.now(),
     )
     db.add(participant)
     db.commit()
@@ -173,6 +180,7 @@ def get_session_messages(
     """Get messages for a session, optionally after a specific ID"""
     return (
         db.query(models.CollaborationMessage)
+        .options(*MESSAGE_LOAD_OPTIONS)
         .filter(
             models.CollaborationMessage.session_id == session_id,
             models.CollaborationMessage.id > after_id,
@@ -219,12 +227,11 @@ def get_message_attachments(
 
 def get_request_by_external_id(db: Session, external_id: str):
     """Get a request by external ID stored in external_metadata"""
-    requests = db.query(models.Request).all()
-    for request in requests:
-        if (
-            request.external_metadata
-            and "analytics_hub_id" in request.external_metadata
-        ):
-            if request.external_metadata["analytics_hub_id"] == str(external_id):
-                return request
-    return None
+    return (
+        db.query(models.Request)
+        .filter(
+            models.Request.external_metadata["analytics_hub_id"].astext
+            == str(external_id)
+        )
+        .first()
+    )
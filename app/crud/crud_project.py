@@ -6,7 +6,7 @@ from typing import List
 
 def create_project(db: Session, project: schemas.ProjectCreate, user_id: int):
     """Create a project as an optional grouping mechanism."""
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = db.get(models.User, user_id)
     if user.user_type != models.UserType.client:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Only clients can create projects"
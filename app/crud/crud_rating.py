@@ -3,6 +3,7 @@ from sqlalchemy import func
 from fastapi import HTTPException, status
 from typing import Optional
 
+from ..database import upsert
 from ..models import (
     DeveloperProfile,
     DeveloperRating,
@@ -29,32 +30,24 @@ class RatingCRUD:
         if not developer:
             raise HTTPException(status_code=404, detail="Developer not found")
 
-        # Check if rating already exists
-        existing_rating = (
-            db.query(DeveloperRating)
-            .filter(
-                DeveloperRating.developer_id == developer_id,
-                DeveloperRating.user_id == user_id,
-            )
-            .first()
-        )
-
         try:
-            if existing_rating:
-                # Update existing rating
-                existing_rating.stars = rating_data.stars
-                existing_rating.comment = rating_data.comment
-                rating = existing_rating
-            else:
-                # Create new rating
-                rating = DeveloperRating(
-                    developer_id=developer_id,
-                    user_id=user_id,
-                    stars=rating_data.stars,
-                    comment=rating_data.comment,
-                )
-                db.add(rating)
-
+            # Create the rating, or update this user's existing one
+            rating = upsert(
+                db,
+                DeveloperRating,
+                {
+                    "developer_id": developer_id,
+                    "user_id": user_id,
+                    "stars": rating_data.stars,
+                    "comment": rating_data.comment,
+                },
+                ["developer_id", "user_id"],
+                update={
+                    "stars": rating_data.stars,
+                    "comment": rating_data.comment,
+                    "updated_at": func.now(),
+                },
+            )
             db.commit()
             db.refresh(rating)
             return rating
@@ -74,16 +67,6 @@ class RatingCRUD:
         if not developer:
             raise HTTPException(status_code=404, detail="Developer not found")
 
-        # Get rating statistics
-        stats = (
-            db.query(
-                func.avg(DeveloperRating.stars).label("average"),
-                func.count(DeveloperRating.id).label("total"),
-            )
-            .filter(DeveloperRating.developer_id == developer_id)
-            .first()
-        )
-
         # Get rating distribution
         distribution = dict.fromkeys(range(1, 6), 0)
         ratings = (
@@ -97,8 +80,8 @@ class RatingCRUD:
             distribution[rating] = count
 
         return DeveloperRatingStats(
-            average_rating=float(stats.average) if stats.average else 0.0,
-            total_ratings=stats.total,
+            average_rating=developer.rating,
+            total_ratings=developer.total_ratings,
             rating_distribution=distribution,
         )
 
@@ -134,7 +117,7 @@ class RatingCRUD:
         rating_data: DeveloperRatingCreate,
     ):
         # Verify the showcase exists
-        showcase = db.query(Showcase).filter(Showcase.id == showcase_id).first()
+        showcase = db.get(Showcase, showcase_id)
         if not showcase:
             raise HTTPException(status_code=404, detail="Showcase not found")
 
@@ -174,20 +157,10 @@ class RatingCRUD:
         self, db: Session, showcase_id: int
     ) -> DeveloperRatingStats:
         # Verify the showcase exists
-        showcase = db.query(Showcase).filter(Showcase.id == showcase_id).first()
+        showcase = db.get(Showcase, showcase_id)
         if not showcase:
             raise HTTPException(status_code=404, detail="Showcase not found")
 
-        # Get rating statistics
-        stats = (
-            db.query(
-                func.avg(ShowcaseRating.rating).label("average"),
-                func.count(ShowcaseRating.id).label("total"),
-            )
-            .filter(ShowcaseRating.showcase_id == showcase_id)
-            .first()
-        )
-
         # Get rating distribution
         distribution = dict.fromkeys(range(1, 6), 0)
         ratings = (
@@ -201,8 +174,8 @@ class RatingCRUD:
             distribution[rating] = count
 
         return DeveloperRatingStats(
-            average_rating=float(stats.average) if stats.average else 0.0,
-            total_ratings=stats.total,
+            average_rating=showcase.average_rating,
+            total_ratings=showcase.total_ratings,
             rating_distribution=distribution,
         )
 
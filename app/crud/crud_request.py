@@ -1,5 +1,5 @@
 from sqlalchemy.orm import joinedload, Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func
 from typing import Optional
 from fastapi import HTTPException
 import re
@@ -10,14 +10,13 @@ from app import models, schemas
 from sqlalchemy.orm import joinedload, contains_eager
 from sqlalchemy import and_
 from fastapi import HTTPException
-from datetime import datetime
 from typing import List, Optional
+from app.database import eager, upsert
 from app.models import Request
 from app.schemas import RequestUpdate
 from sqlalchemy.orm import joinedload, contains_eager
 from sqlalchemy import and_
 from fastapi import HTTPException
-from datetime import datetime
 from app.models import Request, User
 
 # ------------------ Utility Functions ------------------
@@ -58,7 +57,7 @@ def has_edit_permission(db: Session, request: models.Request, user_id: int) -> b
 
 
 def create_request(db: Session, request: schemas.RequestCreate, user_id: int):
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = db.get(models.User, user_id)
 
     db_request = models.Request(
         title=request.title,
@@ -130,7 +129,7 @@ def get_request_by_id(db: Session, request_id: int):
 
     if request:
         # Add the owner's username to the request object
-        owner = db.query(models.User).filter(models.User.id == request.user_id).first()
+        owner = db.get(models.User, request.user_id)
         setattr(request, "owner_username", owner.username if owner else "Unknown")
 
     return request
@@ -152,7 +151,7 @@ def update_request(
         raise HTTPException(status_code=404, detail="Request not found")
 
     # Get the owner info
-    owner = db.query(User).filter(User.id == request.user_id).first()
+    owner = db.get(User, request.user_id)
     if not owner:
         raise HTTPException(status_code=404, detail="Request owner not found")
 
@@ -225,28 +224,20 @@ def share_request(
             status_code=400, detail="Cannot share requests containing sensitive data"
         )
 
-    existing_share = (
-        db.query(models.RequestShare)
-        .filter(
-            and_(
-                models.RequestShare.request_id == request_id,
-                models.RequestShare.shared_with_user_id == share.shared_with_user_id,
-            )
-        )
-        .first()
+    db_share = upsert(
+        db,
+        models.RequestShare,
+        {
+            "request_id": request_id,
+            "shared_with_user_id": share.shared_with_user_id,
+            "can_edit": share.can_edit,
+        },
+        ["request_id", "shared_with_user_id"],
     )
-
-    if existing_share:
+    if not db_share:
         raise HTTPException(
             status_code=400, detail="Request is already shared with this user"
         )
-
-    db_share = models.RequestShare(
-        request_id=request_id,
-        shared_with_user_id=share.shared_with_user_id,
-        can_edit=share.can_edit,
-    )
-    db.add(db_share)
     db.commit()
     db.refresh(db_share)
     return db_share
@@ -343,11 +334,11 @@ def add_request_to_project(db: Session, request_id: int, project_id: int, user_i
         )
 
     # Get the owner's username
-    owner = db.query(models.User).filter(models.User.id == request.user_id).first()
+    owner = db.get(models.User, request.user_id)
 
     # Update the request
     request.project_id = project_id
-    request.added_to_project_at = datetime.utcnow()
+    request.added_to_project_at = func.now()
 
     db.commit()
     db.refresh(request)
@@ -425,10 +416,12 @@ def get_requests_by_user(
         query = (
             db.query(models.Request)
             .join(models.User, models.Request.user_id == models.User.id)
-            .options(contains_eager(models.Request.user))
             .options(
-                joinedload(models.Request.shared_with).joinedload(
-                    models.RequestShare.user
+                *eager(
+                    contains_eager(models.Request.user),
+                    joinedload(models.Request.shared_with).joinedload(
+                        models.RequestShare.user
+                    ),
                 )
             )
             .filter(
@@ -469,10 +462,12 @@ def get_requests_by_user(
                     models.Request.id == models.RequestShare.request_id,
                 )
                 .join(models.User, models.Request.user_id == models.User.id)
-                .options(contains_eager(models.Request.user))
                 .options(
-                    joinedload(models.Request.shared_with).joinedload(
-                        models.RequestShare.user
+                    *eager(
+                        contains_eager(models.Request.user),
+                        joinedload(models.Request.shared_with).joinedload(
+                            models.RequestShare.user
+                        ),
                     )
                 )
                 .filter(models.RequestShare.shared_with_user_id == user_id)
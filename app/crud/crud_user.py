@@ -30,7 +30,7 @@ def search_clients(db: Session, username_prefix: str, limit: int = 5):
 
 def get_user_by_id(db: Session, user_id: int):
     """Get user by ID with profile information."""
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = db.get(models.User, user_id)
     if user:
         if user.user_type == UserType.developer:
             user.developer_profile = db.query(models.DeveloperProfile).filter(
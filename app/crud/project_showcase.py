@@ -1,3 +1,4 @@
+from sqlalchemy import text
 from sqlalchemy.orm import Session, selectinload, joinedload
 import boto3
 import os
@@ -111,9 +112,8 @@ async def create_project_showcase(
         # Create showcase with exact fields from schema
         showcase_dict = showcase.model_dump()
 
-        # Remove video_ids and include_profile from dict as they're not db columns
-        video_ids = showcase_dict.pop("video_ids", [])
-        include_profile = showcase_dict.pop("include_profile", False)
+        # selected_video_ids isn't a db column; linking videos is a separate step
+        showcase_dict.pop("selected_video_ids", None)
 
         db_showcase = models.Showcase(
             **showcase_dict,
@@ -136,21 +136,17 @@ async def create_project_showcase(
 
 def get_project_showcase(db: Session, showcase_id: int):
     """Get a single project showcase by ID"""
-    return db.query(models.Showcase).filter(models.Showcase.id == showcase_id).first()
+    return db.get(models.Showcase, showcase_id)
 
 
-async def get_developer_showcases(
+def get_developer_showcases(
     db: Session, developer_id: int, skip: int = 0, limit: int = 100
 ):
     try:
         return (
             db.query(models.Showcase)
             .filter(models.Showcase.developer_id == developer_id)
-            .options(
-                selectinload(models.Showcase.videos),
-                selectinload(models.Showcase.ratings),
-                selectinload(models.Showcase.developer).load_only("id", "username"),
-            )
+            .options(*models.Showcase.load_options())
             .offset(skip)
             .limit(limit)
             .all()
@@ -245,3 +241,36 @@ def delete_project_showcase(db: Session, showcase_id: int, developer_id: int):
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def get_ranked_showcases(db: Session, limit: int):
+    """
+    Top showcases by ranking score, read from the showcase_leaderboard
+    materialized view so the window-function scan over every showcase
+    happens at refresh time instead of on each request.
+    """
+    showcase_ids = db.scalars(
+        text(
+            "SELECT id FROM showcase_leaderboard "
+            "ORDER BY ranking_score DESC, id LIMIT :limit"
+        ),
+        {"limit": limit},
+    ).all()
+    if not showcase_ids:
+        return []
+
+    showcases = (
+        db.query(models.Showcase)
+        .options(*models.Showcase.load_options())
+        .filter(models.Showcase.id.in_(showcase_ids))
+        .all()
+    )
+    position = {showcase_id: idx for idx, showcase_id in enumerate(showcase_ids)}
+    showcases.sort(key=lambda showcase: position[showcase.id])
+    return showcases
+
+
+def refresh_showcase_leaderboard(db: Session):
+    """Recompute showcase_leaderboard without blocking readers."""
+    db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY showcase_leaderboard"))
+    db.commit()
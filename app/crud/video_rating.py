@@ -5,6 +5,7 @@ from sqlalchemy import func
 from fastapi import HTTPException
 from typing import Optional
 
+from ..database import upsert
 from ..models import Video, VideoRating
 from ..schemas import DeveloperRatingCreate, VideoRatingResponse
 
@@ -17,32 +18,20 @@ class VideoRatingCRUD:
         user_id: int,
         rating_data: DeveloperRatingCreate,
     ):
-        # Check if rating exists
-        existing_rating = (
-            db.query(VideoRating)
-            .filter(
-                VideoRating.video_id == video_id,
-                VideoRating.rater_id == user_id,
-            )
-            .first()
-        )
-
         try:
-            if existing_rating:
-                # Update existing rating
-                existing_rating.stars = rating_data.stars
-                existing_rating.comment = rating_data.comment
-                rating = existing_rating
-            else:
-                # Create new rating
-                rating = VideoRating(
-                    video_id=video_id,
-                    rater_id=user_id,
-                    stars=rating_data.stars,
-                    comment=rating_data.comment,
-                )
-                db.add(rating)
-
+            # Create the rating, or update this user's existing one
+            rating = upsert(
+                db,
+                VideoRating,
+                {
+                    "video_id": video_id,
+                    "rater_id": user_id,
+                    "stars": rating_data.stars,
+                    "comment": rating_data.comment,
+                },
+                ["video_id", "rater_id"],
+                update={"stars": rating_data.stars, "comment": rating_data.comment},
+            )
             db.commit()
             db.refresh(rating)
             return rating
@@ -1,7 +1,8 @@
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+import asyncio
 from dotenv import load_dotenv
 import os
 from app.routers import (
@@ -32,6 +33,9 @@ from starlette.types import ASGIApp
 import logging
 import sys
 from app.routers import oauth
+from app.config import settings
+from app.database import SessionLocal
+from app.crud.project_showcase import refresh_showcase_leaderboard
 from starlette.middleware.sessions import SessionMiddleware
 from pathlib import Path
 from datetime import datetime
@@ -77,9 +81,73 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
+def build_route_tables(app: FastAPI) -> dict:
+    """
+    Renders the administrative route listings once so the endpoints serving
+    them don't walk ``app.routes`` on every call.
+    """
+    api_routes = sorted(
+        (route for route in app.routes if isinstance(route, APIRoute)),
+        key=lambda route: route.path,
+    )
+
+    routes = [
+        {
+            "path": route.path,
+            "name": route.name,
+            "methods": list(route.methods),
+            "endpoint": route.endpoint.__name__ if route.endpoint else None,
+            "tags": route.tags,
+        }
+        for route in api_routes
+    ]
+
+    descriptions = []
+    simple = []
+    for route in api_routes:
+        methods = ", ".join(route.methods)
+        descriptions.append(
+            f"Path: {route.path}\n"
+            f"Methods: {methods}\n"
+            f"Name: {route.name}\n"
+            f"Tags: {', '.join(route.tags) if route.tags else 'None'}\n"
+            f"Endpoint: {route.endpoint.__name__ if route.endpoint else 'None'}\n"
+        )
+        simple.append(f"{methods}: {route.path}")
+
+    return {
+        "routes": JSONResponse(content={"routes": routes}),
+        "description": PlainTextResponse("\n".join(descriptions)),
+        "simple": PlainTextResponse("\n".join(simple)),
+    }
+
+
+def _refresh_leaderboard():
+    db = SessionLocal()
+    try:
+        refresh_showcase_leaderboard(db)
+    finally:
+        db.close()
+
+
+async def refresh_leaderboard_periodically():
+    while True:
+        await asyncio.sleep(settings.leaderboard_refresh_seconds)
+        try:
+            await asyncio.to_thread(_refresh_leaderboard)
+        except Exception:
+            logger.exception("Failed to refresh showcase_leaderboard")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # All routers are registered by the time startup runs
+    app.state.route_tables = build_route_tables(app)
+    leaderboard_task = asyncio.create_task(refresh_leaderboard_periodically())
     yield
+    leaderboard_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await leaderboard_task
 
 
 app = FastAPI(
@@ -147,22 +215,9 @@ app.include_router(oauth.router)
 # Add this line to include the LinkedIn OAuth router
 
 
-@app.get("/routes")
+@app.get("/routes", include_in_schema=False)
 async def get_routes():
-    routes = []
-    for route in app.routes:
-        if isinstance(route, APIRoute):
-            routes.append(
-                {
-                    "path": route.path,
-                    "name": route.name,
-                    "methods": list(route.methods),
-                    "endpoint": route.endpoint.__name__ if route.endpoint else None,
-                    "tags": route.tags,
-                }
-            )
-    routes.sort(key=lambda x: x["path"])
-    return {"routes": routes}
+    return app.state.route_tables["routes"]
 
 
 @app.get("/api-test")
@@ -173,40 +228,20 @@ async def api_test():
     )
 
 
-@app.get("/routes-description", response_class=PlainTextResponse)
+@app.get("/routes-description", include_in_schema=False)
 async def get_routes_description():
     """
     Returns a human-readable description of all the routes in the application.
     """
-    routes = []
-    for route in app.routes:
-        if isinstance(route, APIRoute):
-            methods = ", ".join(route.methods)
-            route_description = (
-                f"Path: {route.path}\n"
-                f"Methods: {methods}\n"
-                f"Name: {route.name}\n"
-                f"Tags: {', '.join(route.tags) if route.tags else 'None'}\n"
-                f"Endpoint: {route.endpoint.__name__ if route.endpoint else 'None'}\n"
-            )
-            routes.append(route_description)
-
-    # Join all routes' descriptions into a single plain text response
-    return "\n".join(routes)
-
-
-@app.get("/routes-simple", response_class=PlainTextResponse)
+    return app.state.route_tables["description"]
+
+
+@app.get("/routes-simple", include_in_schema=False)
 async def get_routes_simple():
     """
     Returns a concise list of all routes with their paths and methods.
     """
-    routes = []
-    for route in app.routes:
-        if isinstance(route, APIRoute):
-            methods = ", ".join(route.methods)
-            routes.append(f"{methods}: {route.path}")
-
-    return "\n".join(routes)
+    return app.state.route_tables["simple"]
 
 
 @app.get("/test")
@@ -231,16 +266,3 @@ async def test_oauth():
         "message": "OAuth test endpoint working",
         "timestamp": datetime.now().isoformat()
     }
-
-@app.get("/routes-simple", response_class=PlainTextResponse)
-async def get_routes_simple():
-    """
-    Returns a concise list of all routes with their paths and methods.
-    """
-    routes = []
-    for route in app.routes:
-        if isinstance(route, APIRoute):
-            methods = ", ".join(route.methods)
-            routes.append(f"{methods}: {route.path}")
-
-    return "\n".join(routes)
\ No newline at end of file
@@ -1,18 +1,15 @@
 # middleware.py
 from fastapi import Depends, HTTPException
-from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 from . import database, oauth2, models
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 import pytz
 from fastapi import status
-from .database import get_db
 
 
 async def require_active_subscription(
     current_user: models.User = Depends(oauth2.get_current_user),
-    db: Session = Depends(get_db),
 ):
     """
     Middleware modified to allow all users through without subscription check.
@@ -1,6 +1,7 @@
 from sqlalchemy import (
     Column,
     Integer,
+    SmallInteger,
     String,
     Boolean,
     Enum as SQLAlchemyEnum,
@@ -10,19 +11,16 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
     Float,
-    JSON,
     text,
     CheckConstraint,
-    ARRAY,
+    Index,
 )
-from sqlalchemy.orm import relationship, backref
+from sqlalchemy.orm import relationship, joinedload, selectinload
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY
 import enum
-from datetime import datetime
-from .database import Base
+from .database import Base, eager
 from sqlalchemy import Table
-from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.dialects.postgresql import JSONB
 
 
@@ -62,6 +60,19 @@ class VideoType(str, enum.Enum):
     tutorials = "tutorials"
 
 
+class SubscriptionStatus(str, enum.Enum):
+    active = "active"
+    canceled = "canceled"
+    past_due = "past_due"
+    expired = "expired"
+
+
+class CollaborationSessionStatus(str, enum.Enum):
+    open = "open"
+    in_progress = "in_progress"
+    resolved = "resolved"
+
+
 class ProductType(str, enum.Enum):
     BROWSER_EXTENSION = "browser_extension"
     WEB_APP = "web_app"
@@ -79,49 +90,77 @@ class PricingModel(str, enum.Enum):
 # ------------------ User Model ------------------
 class User(Base):
     __tablename__ = "users"
-    __table_args__ = {
-        "extend_existing": True
-    }  # Add this to prevent duplicate table errors
+    __table_args__ = (
+        # One account per Stripe customer; most users never get one
+        Index(
+            "ix_users_stripe_customer_id",
+            "stripe_customer_id",
+            unique=True,
+            postgresql_where=text("stripe_customer_id IS NOT NULL"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     username = Column(String, unique=True, index=True, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
     full_name = Column(String, nullable=False)
     password = Column(String, nullable=False)  # Hashed password
-    is_active = Column(Boolean, default=True)
-    user_type = Column(SQLAlchemyEnum(UserType), nullable=True)
-    terms_accepted = Column(Boolean, nullable=False, default=False)
+    is_active = Column(Boolean, default=True, server_default=text("true"))
+    user_type = Column(
+        SQLAlchemyEnum(
+            UserType,
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+            name="check_user_type",
+        ),
+        nullable=True,
+    )
+    terms_accepted = Column(
+        Boolean, nullable=False, default=False, server_default=text("false")
+    )
     created_at = Column(
         TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
     )
 
-    # Add this line to store JWT token (Optional, based on your auth method)
-    token = Column(String, nullable=True)  # Stores JWT token if needed
-
     # OAuth Users (if using external authentication)
     google_id = Column(String, unique=True, nullable=True)
     github_id = Column(String, unique=True, nullable=True)
     linkedin_id = Column(String, unique=True, nullable=True)
-    needs_role_selection = Column(Boolean, default=False)
     stripe_customer_id = Column(String, nullable=True)
-    needs_role_selection = Column(Boolean, default=True)
+    needs_role_selection = Column(Boolean, default=True, server_default=text("true"))
 
     # Relationships
-    videos = relationship("Video", back_populates="user", cascade="all, delete-orphan")
+    videos = relationship(
+        "Video",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
     requests = relationship(
-        "Request", back_populates="user", cascade="all, delete-orphan"
+        "Request",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     projects = relationship(
-        "Project", back_populates="user", cascade="all, delete-orphan"
+        "Project",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     shared_requests = relationship(
         "RequestShare",
         foreign_keys="[RequestShare.shared_with_user_id]",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     request_comments = relationship(
-        "RequestComment", back_populates="user", cascade="all, delete-orphan"
+        "RequestComment",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     developer_profile = relationship(
         "DeveloperProfile",
@@ -134,12 +173,14 @@ class User(Base):
         back_populates="user",
         uselist=False,
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     subscription = relationship(
         "Subscription",
         back_populates="user",
         uselist=False,
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     showcases = relationship(
@@ -155,7 +196,10 @@ class User(Base):
     )
 
     donations = relationship(
-        "Donation", back_populates="user", cascade="all, delete-orphan"
+        "Donation",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     oauth_connections = relationship("OAuthConnection", back_populates="user")
@@ -164,39 +208,54 @@ class User(Base):
         "VideoPlaylist",
         back_populates="creator",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         foreign_keys="[VideoPlaylist.creator_id]",
     )
 
+    # Not read through the user; raise instead of silently lazy loading
+    tokens = relationship(
+        "UserToken", back_populates="user", lazy="raise_on_sql", passive_deletes=True
+    )
+    snagged_requests = relationship(
+        "SnaggedRequest",
+        back_populates="developer",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    collaboration_participants = relationship(
+        "CollaborationParticipant", back_populates="user", lazy="select"
+    )
+
 
 # ------------------ OAuth ------------------
 class UserToken(Base):
     __tablename__ = "user_tokens"
-    __table_args__ = {"extend_existing": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     provider = Column(String, nullable=False)  # e.g., 'google', 'github', 'linkedin'
     access_token = Column(Text, nullable=False)  # OAuth access token
     refresh_token = Column(Text, nullable=True)  # Optional refresh token
     expires_at = Column(DateTime, nullable=True)  # Expiration timestamp
 
-    user = relationship("User", backref="tokens")
+    user = relationship("User", back_populates="tokens")
 
 
 class OAuthConnection(Base):
     __tablename__ = "oauth_connections"
-    __table_args__ = {"extend_existing": True}
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"))
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
     provider = Column(String)  # "google", "github", "linkedin"
     provider_user_id = Column(String)  # ID from the provider
     access_token = Column(String, nullable=True)
     refresh_token = Column(String, nullable=True)
     expires_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
 
     user = relationship("User", back_populates="oauth_connections")
 
@@ -206,9 +265,10 @@ showcase_videos = Table(
     "showcase_videos",
     Base.metadata,
     Column("showcase_id", Integer, ForeignKey("showcases.id", ondelete="CASCADE")),
-    Column("video_id", Integer, ForeignKey("videos.id", ondelete="CASCADE")),
+    Column(
+        "video_id", Integer, ForeignKey("videos.id", ondelete="CASCADE"), index=True
+    ),
     UniqueConstraint("showcase_id", "video_id", name="unique_showcase_video"),
-    extend_existing=True,  # Add this to prevent duplicate table errors
 )
 
 
@@ -217,19 +277,22 @@ class VideoRating(Base):
     __table_args__ = (
         CheckConstraint("stars >= 1 AND stars <= 5", name="check_video_stars_range"),
         UniqueConstraint("video_id", "rater_id", name="unique_video_rating"),
-        {"extend_existing": True},
     )
 
-    id = Column(Integer, primary_key=True, index=True)
-    video_id = Column(Integer, ForeignKey("videos.id"), nullable=False)
-    rater_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    video_id = Column(
+        Integer, ForeignKey("videos.id", ondelete="CASCADE"), nullable=False
+    )
+    rater_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     stars = Column(Integer, nullable=False)
     comment = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
     video = relationship("Video", back_populates="ratings")
-    rater = relationship("User")
+    rater = relationship("User", lazy="joined", innerjoin=True)
 
 
 class ShowcaseRating(Base):
@@ -237,36 +300,47 @@ class ShowcaseRating(Base):
     __table_args__ = (
         CheckConstraint("stars >= 1 AND stars <= 5", name="check_stars_range"),
         UniqueConstraint("showcase_id", "rater_id", name="unique_showcase_rating"),
-        {"extend_existing": True},
     )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     showcase_id = Column(
         Integer,
         ForeignKey("showcases.id", ondelete="CASCADE"),
         nullable=False,
     )
-    rater_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    rater_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     stars = Column(Integer, nullable=False)  # Changed from rating to stars
     comment = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
     showcase = relationship("Showcase", back_populates="ratings")
-    rater = relationship("User")
+    rater = relationship("User", lazy="joined", innerjoin=True)
 
 
 # New model in app/models.py
 class VideoPlaylist(Base):
     __tablename__ = "video_playlists"
+    __table_args__ = (
+        Index(
+            "ix_video_playlists_share_token",
+            "share_token",
+            unique=True,
+            postgresql_where=text("share_token IS NOT NULL"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
-    creator_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    creator_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
-    is_public = Column(Boolean, default=True)
-    share_token = Column(String, unique=True, nullable=True)  # Add this line
+    is_public = Column(Boolean, default=True, server_default=text("true"))
+    share_token = Column(String, nullable=True)
 
     # Relationships
     creator = relationship("User", back_populates="playlists")
@@ -280,10 +354,15 @@ class PlaylistVideo(Base):
     playlist_id = Column(
         Integer, ForeignKey("video_playlists.id", ondelete="CASCADE"), primary_key=True
     )
+    # Second primary key column; indexed for cascades from videos
     video_id = Column(
-        Integer, ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True
+        Integer,
+        ForeignKey("videos.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
     )
-    order = Column(Integer, default=0)  # For ordering videos in playlist
+    # For ordering videos in playlist
+    order = Column(Integer, default=0, server_default="0")
     added_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
     # Relationships
@@ -294,41 +373,72 @@ class PlaylistVideo(Base):
 # Update the existing Video model
 class Video(Base):
     __tablename__ = "videos"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index(
+            "ix_videos_share_token",
+            "share_token",
+            unique=True,
+            postgresql_where=text("share_token IS NOT NULL"),
+        ),
+        # "My videos, newest first"; also serves plain user_id lookups
+        Index("ix_videos_user_upload_date", "user_id", text("upload_date DESC")),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True)
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
     description = Column(String, nullable=True)
     file_path = Column(String, nullable=False)
     thumbnail_path = Column(String, nullable=True)
     upload_date = Column(DateTime(timezone=True), server_default=func.now())
     project_id = Column(
-        Integer, ForeignKey("projects.id", ondelete="SET NULL"), nullable=True
+        Integer,
+        ForeignKey("projects.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
     request_id = Column(
-        Integer, ForeignKey("requests.id", ondelete="SET NULL"), nullable=True
+        Integer,
+        ForeignKey("requests.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
     user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     video_type = Column(
-        SQLAlchemyEnum(VideoType), nullable=False, default=VideoType.solution_demo
+        SQLAlchemyEnum(
+            VideoType,
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+            name="check_video_type",
+        ),
+        nullable=False,
+        default=VideoType.solution_demo,
     )
-    share_token = Column(String, unique=True, nullable=True, index=True)
+    share_token = Column(String, nullable=True)
     project_url = Column(String, nullable=True)
-    is_public = Column(Boolean, default=False)
+    is_public = Column(Boolean, default=False, server_default=text("false"))
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
-    user = relationship("User", back_populates="videos")
+    user = relationship("User", back_populates="videos", lazy="joined", innerjoin=True)
     project = relationship("Project", back_populates="videos")
     request = relationship("Request", back_populates="videos")
-    votes = relationship("Vote", back_populates="video", cascade="all, delete-orphan")
+    votes = relationship(
+        "Vote",
+        back_populates="video",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
     showcases = relationship(
         "Showcase", secondary=showcase_videos, back_populates="videos"
     )
     ratings = relationship(
-        "VideoRating", back_populates="video", cascade="all, delete-orphan"
+        "VideoRating",
+        back_populates="video",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     playlists = relationship("PlaylistVideo", back_populates="video")
 
@@ -337,9 +447,16 @@ class Video(Base):
 class Showcase(Base):
     __tablename__ = "showcases"
     __mapper_args__ = {"eager_defaults": True}
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index(
+            "ix_showcases_share_token",
+            "share_token",
+            unique=True,
+            postgresql_where=text("share_token IS NOT NULL"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
     image_url = Column(String)
@@ -347,13 +464,25 @@ class Showcase(Base):
     project_url = Column(String)
     repository_url = Column(String)
     demo_url = Column(String)
-    developer_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    developer_profile_id = Column(Integer, ForeignKey("developer_profiles.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    average_rating = Column(Float, default=0.0)
-    total_ratings = Column(Integer, default=0)
-    share_token = Column(String, unique=True, nullable=True)
+    developer_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    developer_profile_id = Column(
+        Integer, ForeignKey("developer_profiles.id"), index=True
+    )
+    created_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    # Maintained by the showcase_ratings_refresh trigger
+    average_rating = Column(Float, nullable=False, server_default="0")
+    total_ratings = Column(Integer, nullable=False, server_default="0")
+    share_token = Column(String, nullable=True)
+    # Rendered linked_content, maintained by the linked_content_refresh triggers
+    linked_content_cache = Column(JSONB, nullable=False, server_default="[]")
 
     developer = relationship(
         "User",
@@ -362,7 +491,7 @@ class Showcase(Base):
         lazy="select",
     )
     developer_profile = relationship(
-        "DeveloperProfile", backref="showcases", lazy="joined"
+        "DeveloperProfile", back_populates="showcases", lazy="select"
     )
     videos = relationship(
         "Video", secondary="showcase_videos", back_populates="showcases", lazy="select"
@@ -371,87 +500,91 @@ class Showcase(Base):
         "ShowcaseRating",
         back_populates="showcase",
         cascade="all, delete-orphan",
-        lazy="select",
+        passive_deletes=True,
+        lazy="selectin",
     )
 
     content_links = relationship(
         "ShowcaseContentLink",
         back_populates="showcase",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select",
     )
 
-    @hybrid_property
+    @classmethod
+    def load_options(cls):
+        """
+        Loader options covering everything the ProjectShowcase response
+        reads. Anything else raises.
+        """
+        return eager(
+            # VideoOut doesn't read video.user; skip its default joined load
+            selectinload(cls.videos).raiseload("*", sql_only=True),
+            joinedload(cls.developer),
+            joinedload(cls.developer_profile).joinedload(DeveloperProfile.user),
+        )
+
+    @property
     def linked_content(self):
-        content = []
-        for link in self.content_links:
-            if link.content_type == "video":
-                video = link.video
-                if video:
-                    content.append(
-                        {
-                            "id": link.id,
-                            "type": "video",
-                            "content_id": video.id,
-                            "title": video.title,
-                            "thumbnail_url": video.thumbnail_path,
-                        }
-                    )
-            elif link.content_type == "profile":
-                profile = link.profile
-                if profile:
-                    content.append(
-                        {
-                            "id": link.id,
-                            "type": "profile",
-                            "content_id": link.content_id,
-                            "developer_name": profile.user.username,
-                            "profile_image_url": profile.profile_image_url,
-                        }
-                    )
-        return content
+        return self.linked_content_cache
 
 
 class ShowcaseContentLink(Base):
     __tablename__ = "showcase_content_links"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        CheckConstraint(
+            "(video_id IS NOT NULL)::int + (profile_user_id IS NOT NULL)::int = 1",
+            name="check_showcase_link_target",
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     showcase_id = Column(
-        Integer, ForeignKey("showcases.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("showcases.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # Exactly one of these is set
+    video_id = Column(
+        Integer,
+        ForeignKey("videos.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    profile_user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
     )
-    content_type = Column(String, nullable=False)  # 'video' or 'profile'
-    content_id = Column(Integer, nullable=False)
     created_at = Column(
         TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Add relationships
     showcase = relationship("Showcase", back_populates="content_links")
-    video = relationship(
-        "Video",
-        primaryjoin="and_(ShowcaseContentLink.content_type=='video', "
-        "ShowcaseContentLink.content_id==Video.id)",
-        foreign_keys=[content_id],
-        viewonly=True,
-    )
-    profile = relationship(
-        "DeveloperProfile",
-        primaryjoin="and_(ShowcaseContentLink.content_type=='profile', "
-        "ShowcaseContentLink.content_id==DeveloperProfile.user_id)",
-        foreign_keys=[content_id],
-        viewonly=True,
-    )
+    video = relationship("Video")
+    profile_user = relationship("User")
 
 
 # ------------------ Profile Models ------------------
 class DeveloperProfile(Base):
     __tablename__ = "developer_profiles"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index(
+            "ix_developer_profiles_skills_normalized",
+            "skills_normalized",
+            postgresql_using="gin",
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
-    skills = Column(String)
+    skills = Column(PG_ARRAY(String), nullable=False, server_default="{}")
+    # Lowercased skills for search, maintained by the skills_normalize trigger
+    skills_normalized = Column(PG_ARRAY(String), nullable=False, server_default="{}")
     experience_years = Column(Integer)
     bio = Column(Text, nullable=True)
     created_at = Column(
@@ -459,25 +592,30 @@ class DeveloperProfile(Base):
     )
 
     # Profile visibility and display
-    is_public = Column(Boolean, default=False)
+    is_public = Column(Boolean, default=False, server_default=text("false"))
     profile_image_url = Column(String, nullable=True)
 
     # Success metrics
-    rating = Column(Float, nullable=True)  # Average rating from clients
-    total_projects = Column(Integer, default=0)
-    success_rate = Column(Float, default=0.0)  # Percentage of successful projects
+    # Client rating aggregates, maintained by the developer_ratings_refresh trigger
+    rating = Column(Float, nullable=False, server_default="0")
+    total_ratings = Column(Integer, nullable=False, server_default="0")
+    total_projects = Column(Integer, default=0, server_default="0")
+    # Percentage of successful projects
+    success_rate = Column(Float, default=0.0, server_default="0")
 
     # Relationship
     user = relationship("User", back_populates="developer_profile")
 
     ratings = relationship("DeveloperRating", back_populates="developer")
+    showcases = relationship(
+        "Showcase", back_populates="developer_profile", lazy="select"
+    )
 
 
 class ClientProfile(Base):
     __tablename__ = "client_profiles"
-    __table_args__ = {"extend_existing": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True)
     company_name = Column(String, nullable=True)
     industry = Column(String, nullable=True)
@@ -493,17 +631,16 @@ class ClientProfile(Base):
 # ------------------ Project Model ------------------
 class Project(Base, TimestampMixin):
     __tablename__ = "projects"
-    __table_args__ = {"extend_existing": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Project metadata
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, server_default=text("true"))
 
     # Relationships
     user = relationship("User", back_populates="projects")
@@ -514,36 +651,64 @@ class Project(Base, TimestampMixin):
 # ------------------ Request and RequestShare Models ------------------
 class Request(Base, TimestampMixin):
     __tablename__ = "requests"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # "My requests" lists are per owner, newest first
+        Index("ix_requests_user_created", "user_id", "created_at"),
+        # The public feed, newest first
+        Index(
+            "ix_requests_public_created",
+            "created_at",
+            postgresql_where=text("is_public"),
+        ),
+        Index(
+            "ix_requests_analytics_hub_id",
+            text("(external_metadata ->> 'analytics_hub_id')"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String, nullable=False)
     content = Column(Text, nullable=False)
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     status = Column(
-        SQLAlchemyEnum(RequestStatus), default=RequestStatus.open, nullable=False
+        SQLAlchemyEnum(
+            RequestStatus,
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+            name="check_request_status",
+        ),
+        default=RequestStatus.open,
+        nullable=False,
     )
 
-    # Optional project grouping
+    # Optional project grouping; project pages and stats filter on it
     project_id = Column(
-        Integer, ForeignKey("projects.id", ondelete="SET NULL"), nullable=True
+        Integer,
+        ForeignKey("projects.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
     added_to_project_at = Column(TIMESTAMP(timezone=True), nullable=True)
 
     # Visibility and sharing
-    is_public = Column(Boolean, default=False)
-    contains_sensitive_data = Column(Boolean, default=False)
+    is_public = Column(Boolean, default=False, server_default=text("false"))
+    contains_sensitive_data = Column(
+        Boolean, default=False, server_default=text("false")
+    )
 
     # Business details
     estimated_budget = Column(Float, nullable=True)
     agreed_amount = Column(Float, nullable=True)
 
     # New fields for idea/collaboration feature
-    is_idea = Column(Boolean, default=False)  # Indicates if this is "Just an Idea"
+    is_idea = Column(
+        Boolean, default=False, server_default=text("false")
+    )  # Indicates if this is "Just an Idea"
     seeks_collaboration = Column(
-        Boolean, default=False
+        Boolean, default=False, server_default=text("false")
     )  # Indicates if owner wants to collaborate
     collaboration_details = Column(
         Text, nullable=True
@@ -559,15 +724,30 @@ class Request(Base, TimestampMixin):
     user = relationship("User", back_populates="requests")
     project = relationship("Project", back_populates="requests")
     shared_with = relationship(
-        "RequestShare", back_populates="request", cascade="all, delete-orphan"
+        "RequestShare",
+        back_populates="request",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     conversations = relationship(
-        "Conversation", back_populates="request", cascade="all, delete-orphan"
+        "Conversation",
+        back_populates="request",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     comments = relationship(
-        "RequestComment", back_populates="request", cascade="all, delete-orphan"
+        "RequestComment",
+        back_populates="request",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     videos = relationship("Video", back_populates="request")
+    snagged_by = relationship(
+        "SnaggedRequest",
+        back_populates="request",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
 
 
 class RequestShare(Base):
@@ -576,17 +756,22 @@ class RequestShare(Base):
         UniqueConstraint(
             "request_id", "shared_with_user_id", name="unique_request_share"
         ),
-        {"extend_existing": True},
+        # "Shared with me" lookups read every column they need from the index
+        Index(
+            "ix_request_shares_shared_with",
+            "shared_with_user_id",
+            postgresql_include=["request_id", "viewed_at", "created_at"],
+        ),
     )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     request_id = Column(
         Integer, ForeignKey("requests.id", ondelete="CASCADE"), nullable=False
     )
     shared_with_user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    can_edit = Column(Boolean, default=False)
+    can_edit = Column(Boolean, default=False, server_default=text("false"))
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
     viewed_at = Column(TIMESTAMP(timezone=True), nullable=True)
 
@@ -598,26 +783,37 @@ class RequestShare(Base):
 # ------------------ Comment Models ------------------
 class RequestComment(Base):
     __tablename__ = "request_comments"
-    __table_args__ = {"extend_existing": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     content = Column(String, nullable=False)
     request_id = Column(
-        Integer, ForeignKey("requests.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("requests.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     parent_id = Column(
-        Integer, ForeignKey("request_comments.id", ondelete="CASCADE"), nullable=True
+        Integer,
+        ForeignKey("request_comments.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
     )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     request = relationship("Request", back_populates="comments")
     user = relationship("User", back_populates="request_comments")
+    parent = relationship(
+        "RequestComment", remote_side=[id], back_populates="replies"
+    )
     replies = relationship(
-        "RequestComment", backref=backref("parent", remote_side=[id])
+        "RequestComment",
+        back_populates="parent",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     votes = relationship(
         "RequestCommentVote", back_populates="comment", cascade="all, delete"
@@ -628,16 +824,21 @@ class RequestCommentVote(Base):
     __tablename__ = "request_comment_votes"
     __table_args__ = (
         UniqueConstraint("user_id", "comment_id", name="unique_request_comment_vote"),
-        {"extend_existing": True},
+        CheckConstraint("vote_type BETWEEN -1 AND 1", name="check_comment_vote_type"),
     )
 
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
     )
+    # The primary key leads with user_id, so lookups and cascades by comment
+    # need their own index
     comment_id = Column(
-        Integer, ForeignKey("request_comments.id", ondelete="CASCADE"), primary_key=True
+        Integer,
+        ForeignKey("request_comments.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
     )
-    vote_type = Column(Integer, nullable=False)  # 1 for upvote, -1 for downvote
+    vote_type = Column(SmallInteger, nullable=False)  # 1 for upvote, -1 for downvote
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     user = relationship("User")
@@ -647,27 +848,38 @@ class RequestCommentVote(Base):
 # ------------------ Conversation Models ------------------
 class Conversation(Base, TimestampMixin):
     __tablename__ = "conversations"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Also serves plain request_id lookups
+        Index("ix_conversations_request_status", "request_id", "status"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     request_id = Column(
         Integer,
         ForeignKey("requests.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
+    # Conversation lists filter on starter OR recipient
     starter_user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     recipient_user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     status = Column(
-        SQLAlchemyEnum(ConversationStatus),
+        SQLAlchemyEnum(
+            ConversationStatus,
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+            name="check_conversation_status",
+        ),
         nullable=False,
         default=ConversationStatus.active,
     )
-    is_external = Column(Boolean, default=False)  # Flag for external conversations
+    is_external = Column(
+        Boolean, default=False, server_default=text("false")
+    )  # Flag for external conversations
     external_source = Column(String, nullable=True)  # "analytics-hub", etc.
     external_reference_id = Column(String, nullable=True)  # ID from external system
     external_metadata = Column(JSONB, nullable=True)  # Metadata from external system
@@ -680,27 +892,35 @@ class Conversation(Base, TimestampMixin):
         "ConversationMessage",
         back_populates="conversation",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     content_links = relationship(
         "ConversationContentLink",
         back_populates="conversation",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
 class ConversationMessage(Base):
     __tablename__ = "conversation_messages"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Messages are always read per conversation in created_at order
+        Index(
+            "ix_conversation_messages_conversation_created",
+            "conversation_id",
+            "created_at",
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     conversation_id = Column(
         Integer,
         ForeignKey("conversations.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     content = Column(Text, nullable=False)
     created_at = Column(
@@ -714,6 +934,7 @@ class ConversationMessage(Base):
         "ConversationContentLink",
         back_populates="message",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
 
@@ -721,22 +942,42 @@ class ConversationContentLink(Base):
     __tablename__ = "conversation_content_links"
     __table_args__ = (
         UniqueConstraint(
-            "message_id", "content_type", "content_id", name="unique_content_link"
+            "message_id", "video_id", name="unique_conversation_video_link"
+        ),
+        UniqueConstraint(
+            "message_id", "profile_user_id", name="unique_conversation_profile_link"
+        ),
+        CheckConstraint(
+            "(video_id IS NOT NULL)::int + (profile_user_id IS NOT NULL)::int = 1",
+            name="check_conversation_link_target",
         ),
-        {"extend_existing": True},
     )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     conversation_id = Column(
-        Integer, ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     message_id = Column(
         Integer,
         ForeignKey("conversation_messages.id", ondelete="CASCADE"),
         nullable=False,
     )
-    content_type = Column(String, nullable=False)  # 'video' or 'profile'
-    content_id = Column(Integer, nullable=False)  # video_id or user_id
+    # Exactly one of these is set
+    video_id = Column(
+        Integer,
+        ForeignKey("videos.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+    profile_user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
     created_at = Column(
         TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
     )
@@ -744,13 +985,14 @@ class ConversationContentLink(Base):
     # Relationships
     conversation = relationship("Conversation", back_populates="content_links")
     message = relationship("ConversationMessage", back_populates="content_links")
+    video = relationship("Video")
+    profile_user = relationship("User")
 
 
 class Feedback(Base):
     __tablename__ = "feedbacks"
-    __table_args__ = {"extend_existing": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String, nullable=True)  # Optional name for anonymous users
     email = Column(String, nullable=True)  # Optional email for anonymous users
     rating = Column(Integer)
@@ -763,18 +1005,19 @@ class Feedback(Base):
 # ------------------ Subscription Model ------------------
 class Subscription(Base):
     __tablename__ = "subscriptions"
-    __table_args__ = {"extend_existing": True}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     stripe_subscription_id = Column(String, unique=True, nullable=False)
     stripe_customer_id = Column(String, unique=True, nullable=False)
-    status = Column(String, nullable=False)  # active, canceled, past_due
+    status = Column(SQLAlchemyEnum(SubscriptionStatus), nullable=False)
     current_period_end = Column(DateTime, nullable=False)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(DateTime, onupdate=datetime.utcnow)
+    created_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at = Column(TIMESTAMP(timezone=True), onupdate=func.now())
 
     # Add to User model
     user = relationship("User", back_populates="subscription")
@@ -782,13 +1025,17 @@ class Subscription(Base):
 
 class Vote(Base):
     __tablename__ = "votes"
-    __table_args__ = {"extend_existing": True}
 
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
     )
+    # Like counts and cascades go by video, which the user-first primary key
+    # can't serve
     video_id = Column(
-        Integer, ForeignKey("videos.id", ondelete="CASCADE"), primary_key=True
+        Integer,
+        ForeignKey("videos.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
     )
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -802,12 +1049,11 @@ class Donation(Base):
     __tablename__ = "donations"
     __table_args__ = (
         CheckConstraint("amount > 0", name="check_positive_amount"),
-        {"extend_existing": True},
     )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True, index=True
     )  # Make nullable
     amount = Column(Integer, nullable=False)
     stripe_session_id = Column(String, unique=True, nullable=False)
@@ -830,15 +1076,14 @@ class DeveloperRating(Base):
         ),
         # Ensure rating is between 1 and 5
         CheckConstraint("stars >= 1 AND stars <= 5", name="stars_range_check"),
-        {"extend_existing": True},
     )
 
     id = Column(Integer, primary_key=True, nullable=False)
+    # Covered by the leading column of unique_developer_user_rating
     developer_id = Column(
         Integer,
         ForeignKey("developer_profiles.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
@@ -858,23 +1103,38 @@ class DeveloperRating(Base):
 # ------------------ Snagged Ticket Model ------------------
 class SnaggedRequest(Base):
     __tablename__ = "snagged_requests"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # One active snag per developer and request; also serves the
+        # developer feed, which only ever lists active snags
+        Index(
+            "ix_snagged_requests_active_developer_request",
+            "developer_id",
+            "request_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     request_id = Column(
-        Integer, ForeignKey("requests.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("requests.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     developer_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     snagged_at = Column(
         TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
     )
-    is_active = Column(Boolean, default=True)  # For soft delete/hide functionality
+    is_active = Column(
+        Boolean, default=True, server_default=text("true")
+    )  # For soft delete/hide functionality
 
     # Relationships
-    request = relationship("Request", backref="snagged_by")
-    developer = relationship("User", backref="snagged_requests")
+    request = relationship("Request", back_populates="snagged_by")
+    developer = relationship("User", back_populates="snagged_requests")
 
 
 # ------------------ Collaboration Session Models ------------------
@@ -882,12 +1142,30 @@ class SnaggedRequest(Base):
 
 class CollaborationSession(Base):
     __tablename__ = "collaboration_sessions"
+    __table_args__ = (
+        UniqueConstraint(
+            "external_ticket_id",
+            "source_system",
+            name="unique_collaboration_session_ticket",
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     external_ticket_id = Column(Integer, nullable=False)
     source_system = Column(String(50), nullable=False)
-    status = Column(String(20), default="open", nullable=False)
-    created_at = Column(DateTime(timezone=True), default=func.now())
+    status = Column(
+        SQLAlchemyEnum(
+            CollaborationSessionStatus,
+            native_enum=False,
+            create_constraint=True,
+            length=32,
+            name="check_collaboration_session_status",
+        ),
+        nullable=False,
+        default=CollaborationSessionStatus.open,
+        server_default="open",
+    )
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     resolved_at = Column(DateTime(timezone=True), nullable=True)
     access_token = Column(String(255), unique=True)
@@ -907,9 +1185,9 @@ class CollaborationSession(Base):
 class CollaborationParticipant(Base):
     __tablename__ = "collaboration_participants"
 
-    id = Column(Integer, primary_key=True, index=True)
-    session_id = Column(Integer, ForeignKey("collaboration_sessions.id"))
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    id = Column(Integer, primary_key=True)
+    session_id = Column(Integer, ForeignKey("collaboration_sessions.id"), index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     email = Column(String(255), nullable=False)
     user_name = Column(String(255), nullable=False)
     user_type = Column(String(50), nullable=False)
@@ -919,23 +1197,31 @@ class CollaborationParticipant(Base):
 
     # Relationships
     session = relationship("CollaborationSession", back_populates="participants")
-    user = relationship("User", backref="collaboration_participants")
+    user = relationship("User", back_populates="collaboration_participants")
     messages = relationship("CollaborationMessage", back_populates="participant")
 
 
 class CollaborationMessage(Base):
     __tablename__ = "collaboration_messages"
+    __table_args__ = (
+        # Messages are always read per session in created_at order
+        Index(
+            "ix_collaboration_messages_session_created",
+            "session_id",
+            "created_at",
+        ),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     session_id = Column(Integer, ForeignKey("collaboration_sessions.id"))
     participant_id = Column(
-        Integer, ForeignKey("collaboration_participants.id"), nullable=True
+        Integer, ForeignKey("collaboration_participants.id"), nullable=True, index=True
     )
     content = Column(Text, nullable=False)
-    message_type = Column(String(50), default="text")
-    created_at = Column(DateTime(timezone=True), default=func.now())
+    message_type = Column(String(50), default="text", server_default="text")
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
     message_metadata = Column(JSONB, nullable=True)
-    is_system = Column(Boolean, default=False)
+    is_system = Column(Boolean, default=False, server_default=text("false"))
 
     # Relationships
     session = relationship("CollaborationSession", back_populates="messages")
@@ -950,13 +1236,15 @@ class CollaborationMessage(Base):
 class CollaborationAttachment(Base):
     __tablename__ = "collaboration_attachments"
 
-    id = Column(Integer, primary_key=True, index=True)
-    message_id = Column(Integer, ForeignKey("collaboration_messages.id"), nullable=True)
+    id = Column(Integer, primary_key=True)
+    message_id = Column(
+        Integer, ForeignKey("collaboration_messages.id"), nullable=True, index=True
+    )
     file_name = Column(String(255), nullable=False)
     file_path = Column(String(255), nullable=False)
     file_type = Column(String(100), nullable=False)
     file_size = Column(Integer, nullable=False)
-    created_at = Column(DateTime(timezone=True), default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     message = relationship("CollaborationMessage", back_populates="attachments")
@@ -1,14 +1,18 @@
 # app/oauth2.py
 import logging
+import threading
+import time
+from collections import OrderedDict
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from . import schemas, database, models
 from .config import settings
 from typing import Optional
-from jose.exceptions import ExpiredSignatureError
+from jwt.exceptions import ExpiredSignatureError
 from sqlalchemy.exc import SQLAlchemyError
 import os
 from dotenv import load_dotenv
@@ -16,6 +20,8 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class OAuth2PasswordBearerOptional(OAuth2PasswordBearer):
     """
@@ -42,6 +48,13 @@ EXTERNAL_API_KEY = os.getenv("EXTERNAL_API_KEY")
 if not EXTERNAL_API_KEY:
     raise ValueError("EXTERNAL_API_KEY not set in environment variables")
 
+# Decoded access tokens keyed by the raw token string, each kept until its exp.
+# A token's claims can't change without its signature changing, so repeat
+# requests with the same bearer token skip the HMAC check and JSON decode.
+TOKEN_CACHE_MAXSIZE = 10_000
+_token_cache: "OrderedDict[str, tuple[float, schemas.TokenData]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 # Define API key scheme for header authentication
 api_key_header = APIKeyHeader(name="X-API-Key")
 
@@ -58,7 +71,7 @@ async def get_api_key(api_key: str = Depends(api_key_header)):
 
 
 def create_access_token(data: dict):
-    print(f"DEBUG: Creating access token with data: {data}")
+    logger.debug("Creating access token with data: %s", data)
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
@@ -66,7 +79,33 @@ def create_access_token(data: dict):
     return encoded_jwt
 
 
+def _cached_token_data(token: str) -> Optional[schemas.TokenData]:
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is None:
+            return None
+        expires_at, token_data = cached
+        if expires_at <= now:
+            del _token_cache[token]
+            return None
+        _token_cache.move_to_end(token)
+        return token_data
+
+
+def _cache_token_data(token: str, expires_at: float, token_data: schemas.TokenData):
+    with _token_cache_lock:
+        _token_cache[token] = (expires_at, token_data)
+        _token_cache.move_to_end(token)
+        while len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+
+
 def verify_access_token(token: str, credentials_exception):
+    token_data = _cached_token_data(token)
+    if token_data is not None:
+        return token_data
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         id: str = payload.get("sub")  # Change to "sub" to match the payload
@@ -78,11 +117,15 @@ def verify_access_token(token: str, credentials_exception):
         if not hasattr(token_data, "id") or token_data.id is None:
             raise ValueError("TokenData missing id attribute")
 
+        # jwt.decode has already rejected expired tokens; only cache ones with exp
+        if payload.get("exp") is not None:
+            _cache_token_data(token, payload["exp"], token_data)
+
         return token_data
-    except JWTError:
+    except PyJWTError:
         raise credentials_exception
     except Exception as e:
-        print(f"DEBUG: Token verification error: {str(e)}")
+        logger.debug("Token verification error: %s", e)
         raise credentials_exception
 
 
@@ -103,7 +146,7 @@ def get_current_user(
         token_data = verify_access_token(token, credentials_exception)
 
         # Use token_data.id instead of token_data.sub
-        user = db.query(models.User).filter(models.User.id == token_data.id).first()
+        user = db.get(models.User, token_data.id)
 
         if user is None:
             raise credentials_exception
@@ -111,7 +154,7 @@ def get_current_user(
         return user
     except SQLAlchemyError as db_error:
         raise HTTPException(status_code=500, detail="A database error occurred.")
-    except JWTError:
+    except PyJWTError:
         raise credentials_exception
 
 
@@ -136,10 +179,10 @@ def get_optional_user(
         if not user_id:
             return None
 
-        user = db.query(models.User).filter(models.User.id == user_id).first()
+        user = db.get(models.User, user_id)
         return user
 
-    except JWTError:
+    except PyJWTError:
         return None  # Invalid token, return None
 
 
@@ -155,7 +198,7 @@ async def verify_api_key(api_key: str = Depends(api_key_header)):
 
 
 # Use the already-defined oauth2_scheme_optional
-async def get_current_user_optional(
+def get_current_user_optional(
     token: Optional[str] = Depends(oauth2_scheme_optional),
     db: Session = Depends(database.get_db),
 ) -> Optional[models.User]:
@@ -166,20 +209,15 @@ async def get_current_user_optional(
     if not token:
         return None
 
-    try:
-        # Your existing token validation logic
-        payload = jwt.decode(
-            token, settings.secret_key, algorithms=[settings.algorithm]
-        )
-        id: str = payload.get("sub")
-
-        if id is None:
-            return None
-
-        user = db.query(models.User).filter(models.User.id == id).first()
-        if not user:
-            return None
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+    )
 
-        return user
-    except JWTError:
+    try:
+        # Shares verify_access_token's decode and token cache
+        token_data = verify_access_token(token, credentials_exception)
+    except HTTPException:
         return None
+
+    return db.get(models.User, token_data.id)
@@ -1,6 +1,6 @@
 # app/routers/conversations.py
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 from typing import List
 from .. import models, schemas, database, oauth2
 from sqlalchemy import or_
@@ -11,6 +11,30 @@ from fastapi import status
 
 router = APIRouter(prefix="/conversations", tags=["Conversations"])
 
+# Load both possible link targets alongside the links themselves
+CONTENT_LINK_TARGETS = (
+    joinedload(models.ConversationContentLink.video),
+    joinedload(models.ConversationContentLink.profile_user),
+)
+
+
+def serialize_content_link(link: models.ConversationContentLink) -> dict:
+    if link.video_id is not None:
+        return {
+            "id": link.id,
+            "type": "video",
+            "content_id": link.video_id,
+            "title": link.video.title,
+            "url": link.video.file_path,
+        }
+    return {
+        "id": link.id,
+        "type": "profile",
+        "content_id": link.profile_user_id,
+        "title": f"{link.profile_user.username}'s Profile",
+        "url": f"/profile/developer/{link.profile_user_id}",
+    }
+
 
 # In routers/conversations.py
 
@@ -111,7 +135,7 @@ def create_message(
         db.add(new_message)
         db.flush()  # Get the message ID without committing
 
-        linked_content = []  # Initialize linked_content list
+        content_links = []
 
         # Handle video links
         if message.video_ids:
@@ -131,63 +155,41 @@ def create_message(
                     detail="One or more videos not found or not owned by user",
                 )
 
-            for video in videos:
-                content_link = models.ConversationContentLink(
-                    conversation_id=id,
-                    message_id=new_message.id,
-                    content_type="video",
-                    content_id=video.id,
-                    title=video.title,
-                    url=video.file_path,
-                )
-                db.add(content_link)
-                linked_content.append(
-                    {
-                        "id": video.id,  # We'll update this after commit
-                        "type": "video",
-                        "content_id": video.id,
-                        "title": video.title,
-                        "url": video.file_path,
-                    }
-                )
+            content_links.extend(
+                {
+                    "conversation_id": id,
+                    "message_id": new_message.id,
+                    "video_id": video.id,
+                    "profile_user_id": None,
+                }
+                for video in videos
+            )
 
         # Handle profile link
         if message.include_profile:
-            print("Adding profile link")
-            profile_link = models.ConversationContentLink(
-                conversation_id=id,
-                message_id=new_message.id,
-                content_type="profile",
-                content_id=current_user.id,
-                title=current_user.username,
-                url=f"/profile/developer/{current_user.id}",
-            )
-            db.add(profile_link)
-            linked_content.append(
+            content_links.append(
                 {
-                    "id": current_user.id,  # We'll update this after commit
-                    "type": "profile",
-                    "content_id": current_user.id,
-                    "title": current_user.username,
-                    "url": f"/profile/developer/{current_user.id}",
+                    "conversation_id": id,
+                    "message_id": new_message.id,
+                    "video_id": None,
+                    "profile_user_id": current_user.id,
                 }
             )
 
+        database.bulk_insert(db, models.ConversationContentLink, content_links)
+
         # Commit all changes
         db.commit()
         db.refresh(new_message)
 
-        # Update the IDs in linked_content with actual ContentLink IDs
         content_links = (
             db.query(models.ConversationContentLink)
+            .options(*CONTENT_LINK_TARGETS)
             .filter(models.ConversationContentLink.message_id == new_message.id)
+            .order_by(models.ConversationContentLink.id)
             .all()
         )
-
-        # Map the content links to their respective linked_content entries
-        for i, link in enumerate(content_links):
-            if i < len(linked_content):
-                linked_content[i]["id"] = link.id
+        linked_content = [serialize_content_link(link) for link in content_links]
 
         response = {
             "id": new_message.id,
@@ -217,10 +219,23 @@ def list_user_conversations(
     db: Session = Depends(database.get_db),
     current_user: models.User = Depends(oauth2.get_current_user),
 ):
-    query = db.query(models.Conversation).filter(
-        or_(
-            models.Conversation.starter_user_id == current_user.id,
-            models.Conversation.recipient_user_id == current_user.id,
+    query = (
+        db.query(models.Conversation)
+        .options(
+            *database.eager(
+                joinedload(models.Conversation.request),
+                joinedload(models.Conversation.starter),
+                joinedload(models.Conversation.recipient),
+                selectinload(models.Conversation.messages)
+                .selectinload(models.ConversationMessage.content_links)
+                .options(*CONTENT_LINK_TARGETS),
+            )
+        )
+        .filter(
+            or_(
+                models.Conversation.starter_user_id == current_user.id,
+                models.Conversation.recipient_user_id == current_user.id,
+            )
         )
     )
 
@@ -231,60 +246,13 @@ def list_user_conversations(
 
     result = []
     for conv in conversations:
-        request = (
-            db.query(models.Request)
-            .filter(models.Request.id == conv.request_id)
-            .first()
-        )
+        request = conv.request
         messages = []
 
-        conversation_messages = (
-            db.query(models.ConversationMessage)
-            .filter(models.ConversationMessage.conversation_id == conv.id)
-            .all()
-        )
-
-        for msg in conversation_messages:
-            content_links = (
-                db.query(models.ConversationContentLink)
-                .filter(models.ConversationContentLink.message_id == msg.id)
-                .all()
-            )
-
-            linked_content = []
-            for link in content_links:
-                if link.content_type == "video":
-                    video = (
-                        db.query(models.Video)
-                        .filter(models.Video.id == link.content_id)
-                        .first()
-                    )
-                    if video:
-                        linked_content.append(
-                            {
-                                "id": link.id,
-                                "type": "video",
-                                "content_id": video.id,
-                                "title": video.title,
-                                "url": video.file_path,
-                            }
-                        )
-                elif link.content_type == "profile":
-                    user = (
-                        db.query(models.User)
-                        .filter(models.User.id == link.content_id)
-                        .first()
-                    )
-                    if user:
-                        linked_content.append(
-                            {
-                                "id": link.id,
-                                "type": "profile",
-                                "content_id": user.id,
-                                "title": f"{user.username}'s Profile",
-                                "url": f"/profile/developer/{user.id}",
-                            }
-                        )
+        for msg in conv.messages:
+            linked_content = [
+                serialize_content_link(link) for link in msg.content_links
+            ]
 
             messages.append(
                 {
@@ -297,14 +265,8 @@ def list_user_conversations(
                 }
             )
 
-        starter = (
-            db.query(models.User).filter(models.User.id == conv.starter_user_id).first()
-        )
-        recipient = (
-            db.query(models.User)
-            .filter(models.User.id == conv.recipient_user_id)
-            .first()
-        )
+        starter = conv.starter
+        recipient = conv.recipient
 
         conv_data = {
             "id": conv.id,
@@ -351,6 +313,11 @@ def get_conversation_messages(
     # Get messages for this conversation
     messages = (
         db.query(models.ConversationMessage)
+        .options(
+            selectinload(models.ConversationMessage.content_links).options(
+                *CONTENT_LINK_TARGETS
+            )
+        )
         .filter(models.ConversationMessage.conversation_id == conversation_id)
         .order_by(models.ConversationMessage.created_at)
         .all()
@@ -358,46 +325,7 @@ def get_conversation_messages(
 
     result = []
     for msg in messages:
-        content_links = (
-            db.query(models.ConversationContentLink)
-            .filter(models.ConversationContentLink.message_id == msg.id)
-            .all()
-        )
-
-        linked_content = []
-        for link in content_links:
-            if link.content_type == "video":
-                video = (
-                    db.query(models.Video)
-                    .filter(models.Video.id == link.content_id)
-                    .first()
-                )
-                if video:
-                    linked_content.append(
-                        {
-                            "id": link.id,
-                            "type": "video",
-                            "content_id": video.id,
-                            "title": video.title,
-                            "url": video.file_path,
-                        }
-                    )
-            elif link.content_type == "profile":
-                user = (
-                    db.query(models.User)
-                    .filter(models.User.id == link.content_id)
-                    .first()
-                )
-                if user:
-                    linked_content.append(
-                        {
-                            "id": link.id,
-                            "type": "profile",
-                            "content_id": user.id,
-                            "title": f"{user.username}'s Profile",
-                            "url": f"/profile/developer/{user.id}",
-                        }
-                    )
+        linked_content = [serialize_content_link(link) for link in msg.content_links]
 
         result.append(
             {
@@ -6,30 +6,27 @@ from sqlalchemy import func
 from typing import Dict, Union
 
 from ..database import get_db
-from ..models import User, DeveloperRating, Video, Showcase, DeveloperProfile
+from ..models import Video, Showcase, DeveloperProfile
 from ..schemas import DeveloperMetricsResponse
 
 router = APIRouter(prefix="/developers", tags=["Developer Metrics"])
 
 
 @router.get("/{developer_id}/metrics", response_model=DeveloperMetricsResponse)
-async def get_developer_metrics(developer_id: int, db: Session = Depends(get_db)):
+def get_developer_metrics(developer_id: int, db: Session = Depends(get_db)):
     # First check if developer exists
-    developer = (
-        db.query(User).join(DeveloperProfile).filter(User.id == developer_id).first()
+    developer_profile = (
+        db.query(DeveloperProfile)
+        .filter(DeveloperProfile.user_id == developer_id)
+        .first()
     )
 
-    if not developer:
+    if not developer_profile:
         raise HTTPException(status_code=404, detail="Developer not found")
 
     try:
-        # Get profile rating from DeveloperRating
-        profile_rating = (
-            db.query(func.coalesce(func.avg(DeveloperRating.stars), 0.0))
-            .join(DeveloperProfile)
-            .filter(DeveloperProfile.user_id == developer_id)
-            .scalar()
-        )
+        # Profile rating is kept current by the developer_ratings_refresh trigger
+        profile_rating = developer_profile.rating
 
         # Get video rating average
         video_rating = (
@@ -65,13 +62,6 @@ async def get_developer_metrics(developer_id: int, db: Session = Depends(get_db)
             .scalar()
         )
 
-        # Get developer profile stats
-        developer_profile = (
-            db.query(DeveloperProfile)
-            .filter(DeveloperProfile.user_id == developer_id)
-            .first()
-        )
-
         return {
             "profile_rating": float(profile_rating),
             "video_rating": float(video_rating),
@@ -80,12 +70,8 @@ async def get_developer_metrics(developer_id: int, db: Session = Depends(get_db)
             "total_videos": total_videos,
             "total_showcases": total_showcases,
             "total_likes": int(total_likes),
-            "total_projects": (
-                developer_profile.total_projects if developer_profile else 0
-            ),
-            "success_rate": (
-                developer_profile.success_rate if developer_profile else 0.0
-            ),
+            "total_projects": developer_profile.total_projects or 0,
+            "success_rate": developer_profile.success_rate or 0.0,
         }
 
     except Exception as e:
@@ -67,29 +67,27 @@ def display_videos(
         # Get all videos
         videos = db.query(models.Video).all()
 
+        # Like counts and the current user's likes for every video at once
+        like_counts = dict(
+            db.query(models.Vote.video_id, func.count())
+            .group_by(models.Vote.video_id)
+            .all()
+        )
+        liked_video_ids = set()
+        if current_user:
+            liked_video_ids = {
+                video_id
+                for (video_id,) in db.query(models.Vote.video_id).filter(
+                    models.Vote.user_id == current_user.id
+                )
+            }
+
         # Process videos
         processed_videos = []
         for video in videos:
             try:
-                # Count likes
-                likes_count = (
-                    db.query(models.Vote)
-                    .filter(models.Vote.video_id == video.id)
-                    .count()
-                )
-
-                # Check if current user liked the video
-                liked = False
-                if current_user:
-                    liked = (
-                        db.query(models.Vote)
-                        .filter(
-                            models.Vote.video_id == video.id,
-                            models.Vote.user_id == current_user.id,
-                        )
-                        .first()
-                        is not None
-                    )
+                likes_count = like_counts.get(video.id, 0)
+                liked = video.id in liked_video_ids
 
                 # Create VideoOut object
                 video_out = schemas.VideoOut(
@@ -131,7 +129,10 @@ def get_user_videos(
 ):
     try:
         user_videos = (
-            db.query(models.Video).filter(models.Video.user_id == current_user.id).all()
+            db.query(models.Video)
+            .filter(models.Video.user_id == current_user.id)
+            .order_by(models.Video.upload_date.desc())
+            .all()
         )
         other_videos = (
             db.query(models.Video).filter(models.Video.user_id != current_user.id).all()
@@ -143,7 +144,7 @@ def get_user_videos(
 
 
 @router.get("/spaces", response_model=List[schemas.SpacesVideoInfo])
-async def list_spaces_videos(
+def list_spaces_videos(
     current_user: schemas.User = Depends(oauth2.get_current_user),
     db: Session = Depends(database.get_db),
 ):
@@ -304,7 +305,7 @@ async def stream_video(
 
 
 @router.get("/shared/{share_token}")
-async def get_shared_video(share_token: str, db: Session = Depends(get_db)):
+def get_shared_video(share_token: str, db: Session = Depends(get_db)):
     # Get the video by share token
     video = db.query(Video).filter(Video.share_token == share_token).first()
 
@@ -337,7 +338,7 @@ async def get_shared_video(share_token: str, db: Session = Depends(get_db)):
 
 
 @router.post("/{video_id}/rating", response_model=VideoRatingResponse)
-async def rate_video(
+def rate_video(
     video_id: int,
     rating_data: DeveloperRatingCreate,
     db: Session = Depends(get_db),
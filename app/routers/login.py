@@ -39,7 +39,7 @@ def login(user_credentials: schemas.UserLogin, db: Session = Depends(database.ge
 
 
 @router.get("/validate-token", response_model=schemas.UserOut)
-async def validate_token(
+def validate_token(
     request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(database.get_db),
@@ -87,21 +87,6 @@ def get_me(
         print(f"DEBUG: /me endpoint called for user ID: {current_user.id}")
         print(f"DEBUG: Current user type: {current_user.user_type}")
 
-        # Get profile information based on user type only if the type is set
-        if current_user.user_type:
-            if current_user.user_type == models.UserType.developer:
-                current_user.developer_profile = (
-                    db.query(models.DeveloperProfile)
-                    .filter(models.DeveloperProfile.user_id == current_user.id)
-                    .first()
-                )
-            elif current_user.user_type == models.UserType.client:
-                current_user.client_profile = (
-                    db.query(models.ClientProfile)
-                    .filter(models.ClientProfile.user_id == current_user.id)
-                    .first()
-                )
-
         # If user_type is None but needs_role_selection is False, set it to True
         if current_user.user_type is None and not getattr(
             current_user, "needs_role_selection", True
@@ -135,7 +120,7 @@ def select_user_role(
     """
     try:
         # Get the current user from the database to ensure we're working with up-to-date data
-        user = db.query(models.User).filter(models.User.id == current_user.id).first()
+        user = db.get(models.User, current_user.id)
 
         if not user:
             raise HTTPException(
@@ -150,7 +135,7 @@ def select_user_role(
         if user_role.user_type == "developer" and not user.developer_profile:
             # Create an empty developer profile
             developer_profile = models.DeveloperProfile(
-                user_id=user.id, skills="", experience_years=0, bio="", is_public=False
+                user_id=user.id, skills=[], experience_years=0, bio="", is_public=False
             )
             db.add(developer_profile)
 
@@ -2,7 +2,6 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import RedirectResponse
 from authlib.integrations.starlette_client import OAuth
 from sqlalchemy.orm import Session
-from jose import jwt
 import os
 import uuid  # For generating unique state
 from app import models, schemas, database, oauth2
@@ -555,7 +554,7 @@ def update_legacy_provider_id(db, user, provider, provider_id):
 
 
 @router.get("/auth/github/token")
-async def github_token(code: str, db: Session = Depends(database.get_db)):
+def github_token(code: str, db: Session = Depends(database.get_db)):
     """
     Exchange GitHub authorization code for access token and user info
     This endpoint is designed for client-side OAuth flow where the state parameter
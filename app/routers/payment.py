@@ -24,7 +24,7 @@ SUBSCRIPTION_PRICE_ID = settings.stripe_price_id
 
 
 @router.post("/create-subscription")
-async def create_subscription(
+def create_subscription(
     db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)
 ):
     try:
@@ -134,7 +134,7 @@ async def handle_subscription_completion(session: dict, db: Session):
 
 
 @router.get("/subscription-status")
-async def get_subscription_status(
+def get_subscription_status(
     db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)
 ):
     subscription = (
@@ -180,7 +180,7 @@ async def get_subscription_status(
 
 
 @router.post("/create-payment-intent")
-async def create_payment_intent(
+def create_payment_intent(
     amount: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
@@ -288,7 +288,7 @@ async def create_payment_intent(
 
 
 @router.post("/confirm-payment")
-async def confirm_payment(
+def confirm_payment(
     payment_intent_id: str,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
@@ -305,7 +305,7 @@ async def confirm_payment(
 
 
 @router.post("/create-checkout-session")
-async def create_checkout_session(
+def create_checkout_session(
     product_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
@@ -318,9 +318,7 @@ async def create_checkout_session(
         if not product:
             raise HTTPException(status_code=404, detail="Product not found")
 
-        developer = (
-            db.query(models.User).filter(models.User.id == product.developer_id).first()
-        )
+        developer = db.get(models.User, product.developer_id)
         if not developer or not developer.stripe_connect_id:
             raise HTTPException(
                 status_code=400, detail="Developer not configured for payments"
@@ -365,7 +363,7 @@ async def create_checkout_session(
 
 
 @router.post("/{product_id}/purchase")
-async def purchase_product(
+def purchase_product(
     product_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
@@ -379,9 +377,7 @@ async def purchase_product(
             raise HTTPException(status_code=404, detail="Product not found")
 
         # Get developer details
-        developer = (
-            db.query(models.User).filter(models.User.id == product.developer_id).first()
-        )
+        developer = db.get(models.User, product.developer_id)
         if not developer or not developer.stripe_connect_id:
             raise HTTPException(
                 status_code=400, detail="Developer not configured for payments"
@@ -437,7 +433,7 @@ async def purchase_product(
 
 
 @router.get("/check-showcase-subscription")
-async def check_showcase_subscription(
+def check_showcase_subscription(
     db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)
 ):
     if current_user.user_type != "developer":  # Changed from userType to user_type
@@ -188,7 +188,6 @@ def create_developer_profile(
     profile_data_dict.update(
         {
             "user_id": current_user.id,
-            "rating": None,
             "total_projects": 0,
             "success_rate": 0.0,
         }
@@ -9,7 +9,7 @@ from fastapi import (
     Query,
 )
 from typing import Optional, List
-from sqlalchemy import func, text
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 import logging
 import os
@@ -20,16 +20,15 @@ import markdown
 import bleach
 import json
 import math
-from sqlalchemy.orm import joinedload
 from ..models import User
 from .. import schemas, models
-from ..database import get_db
+from ..database import get_db, bulk_insert, upsert
 from ..oauth2 import get_current_user
 from ..models import Showcase, ShowcaseRating
-from datetime import datetime
 from ..crud.project_showcase import (
     get_project_showcase,
     delete_project_showcase,
+    get_ranked_showcases as get_ranked_showcases_crud,
 )
 
 
@@ -170,18 +169,14 @@ async def create_showcase(
 
             # Create content link for profile
             profile_content_link = models.ShowcaseContentLink(
-                content_type="profile",
-                content_id=current_user.id,  # Using user_id as content_id for profiles
+                profile_user_id=current_user.id
             )
             db_showcase.content_links.append(profile_content_link)
 
         # Add content links for videos
         if selected_video_ids and videos:
             for video in videos:
-                video_content_link = models.ShowcaseContentLink(
-                    content_type="video",
-                    content_id=video.id,
-                )
+                video_content_link = models.ShowcaseContentLink(video_id=video.id)
                 db_showcase.content_links.append(video_content_link)
 
         # Save to database
@@ -196,20 +191,10 @@ async def create_showcase(
 
 
 @router.get("/{showcase_id}", response_model=schemas.ProjectShowcase)
-async def read_showcase(showcase_id: int, db: Session = Depends(get_db)):
+def read_showcase(showcase_id: int, db: Session = Depends(get_db)):
     db_showcase = (
         db.query(models.Showcase)
-        .options(
-            joinedload(models.Showcase.developer),
-            joinedload(models.Showcase.developer_profile),
-            joinedload(models.Showcase.videos),
-            joinedload(models.Showcase.content_links).joinedload(
-                models.ShowcaseContentLink.video
-            ),
-            joinedload(models.Showcase.content_links).joinedload(
-                models.ShowcaseContentLink.profile
-            ),
-        )
+        .options(*models.Showcase.load_options())
         .filter(models.Showcase.id == showcase_id)
         .first()
     )
@@ -221,11 +206,11 @@ async def read_showcase(showcase_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/developer/{developer_id}", response_model=List[schemas.ProjectShowcase])
-async def get_developer_showcases_route(
+def get_developer_showcases_route(
     developer_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 ):
     try:
-        showcases = await get_developer_showcases_crud(db, developer_id, skip, limit)
+        showcases = get_developer_showcases_crud(db, developer_id, skip, limit)
         return showcases or []
     except Exception as e:
 
@@ -235,12 +220,13 @@ async def get_developer_showcases_route(
 
 
 # Rename the crud function to avoid naming conflict
-async def get_developer_showcases_crud(
+def get_developer_showcases_crud(
     db: Session, developer_id: int, skip: int = 0, limit: int = 100
 ):
     return (
         db.query(Showcase)
         .filter(Showcase.developer_id == developer_id)
+        .options(*Showcase.load_options())
         .offset(skip)
         .limit(limit)
         .all()
@@ -248,7 +234,7 @@ async def get_developer_showcases_crud(
 
 
 @router.put("/{showcase_id}", response_model=schemas.ProjectShowcase)
-async def update_showcase(
+def update_showcase(
     showcase_id: int,
     showcase_data: schemas.ProjectShowcaseUpdate,
     db: Session = Depends(get_db),
@@ -268,14 +254,14 @@ async def update_showcase(
     for field, value in update_data.items():
         setattr(showcase, field, value)
 
-    showcase.updated_at = datetime.utcnow()  # Add this line to update the timestamp
+    showcase.updated_at = func.now()
     db.commit()
     db.refresh(showcase)
     return showcase
 
 
 @router.put("/{showcase_id}/files")
-async def update_showcase_files(
+def update_showcase_files(
     showcase_id: int,
     image_file: Optional[UploadFile] = File(None),
     readme_file: Optional[UploadFile] = File(None),
@@ -413,15 +399,13 @@ async def get_showcase_readme(
 
 
 @router.post("/{showcase_id}/rating", response_model=schemas.ShowcaseRatingResponse)
-async def rate_showcase(
+def rate_showcase(
     showcase_id: int,
     rating: schemas.ShowcaseRatingCreate,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    showcase = (
-        db.query(models.Showcase).filter(models.Showcase.id == showcase_id).first()
-    )
+    showcase = db.get(models.Showcase, showcase_id)
     if not showcase:
         raise HTTPException(status_code=404, detail="Showcase not found")
 
@@ -429,40 +413,23 @@ async def rate_showcase(
         raise HTTPException(status_code=400, detail="Cannot rate your own showcase")
 
     try:
-        # Check for existing rating
-        existing_rating = (
-            db.query(models.ShowcaseRating)
-            .filter(
-                models.ShowcaseRating.showcase_id == showcase_id,
-                models.ShowcaseRating.rater_id == current_user.id,
-            )
-            .first()
-        )
-
-        if existing_rating:
-            existing_rating.stars = rating.stars
-            db.commit()
-        else:
-            new_rating = models.ShowcaseRating(
-                showcase_id=showcase_id, rater_id=current_user.id, stars=rating.stars
-            )
-            db.add(new_rating)
-            db.commit()
-
-        # Update showcase stats
-        stats = (
-            db.query(
-                func.avg(models.ShowcaseRating.stars).label("average"),
-                func.count(models.ShowcaseRating.id).label("total"),
-            )
-            .filter(models.ShowcaseRating.showcase_id == showcase_id)
-            .first()
+        # Create the rating, or update this user's existing one
+        upsert(
+            db,
+            models.ShowcaseRating,
+            {
+                "showcase_id": showcase_id,
+                "rater_id": current_user.id,
+                "stars": rating.stars,
+            },
+            ["showcase_id", "rater_id"],
+            update={"stars": rating.stars},
         )
-
-        showcase.average_rating = float(stats[0]) if stats[0] else 0.0
-        showcase.total_ratings = stats[1] or 0
         db.commit()
 
+        # average_rating/total_ratings are kept current by the
+        # showcase_ratings_refresh trigger; commit expired the showcase, so
+        # these reads pick up the new values
         return {
             "success": True,
             "average_rating": showcase.average_rating,
@@ -476,16 +443,15 @@ async def rate_showcase(
 
 
 @router.get("/{showcase_id}/rating", response_model=schemas.ShowcaseRatingStats)
-async def get_showcase_rating(showcase_id: int, db: Session = Depends(get_db)):
-    # Calculate average rating and total ratings directly from ShowcaseRating table
+def get_showcase_rating(showcase_id: int, db: Session = Depends(get_db)):
+    # Read the trigger-maintained aggregates instead of scanning ShowcaseRating
     rating_stats = (
-        db.query(
-            func.avg(models.ShowcaseRating.stars).label("average_rating"),
-            func.count(models.ShowcaseRating.id).label("total_ratings"),
-        )
-        .filter(models.ShowcaseRating.showcase_id == showcase_id)
+        db.query(models.Showcase.average_rating, models.Showcase.total_ratings)
+        .filter(models.Showcase.id == showcase_id)
         .first()
     )
+    if not rating_stats:
+        return {"average_rating": 0.0, "total_ratings": 0}
 
     return {
         "average_rating": float(rating_stats[0]) if rating_stats[0] else 0.0,
@@ -494,7 +460,7 @@ async def get_showcase_rating(showcase_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{showcase_id}/user-rating", response_model=schemas.ShowcaseRating)
-async def get_user_showcase_rating(
+def get_user_showcase_rating(
     showcase_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
@@ -514,34 +480,15 @@ async def get_user_showcase_rating(
     return rating
 
 
-async def update_showcase_stats(db: Session, showcase_id: int):
-    """Helper function to update showcase rating statistics"""
-    stats = (
-        db.query(
-            func.avg(models.ShowcaseRating.stars).label(
-                "average_rating"
-            ),  # Changed from rating to stars
-            func.count(models.ShowcaseRating.id).label("total_ratings"),
-        )
-        .filter(models.ShowcaseRating.showcase_id == showcase_id)
-        .first()
-    )
-
-    showcase = get_project_showcase(db, showcase_id)
-    if showcase:
-        showcase.average_rating = float(stats[0]) if stats[0] else 0.0
-        showcase.total_ratings = stats[1]
-        db.commit()
-
-
 @router.get("/", response_model=List[schemas.ProjectShowcase])
-async def list_showcases(
+def list_showcases(
     skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 ):
     """Get all project showcases"""
     try:
         showcases = (
             db.query(models.Showcase)
+            .options(*models.Showcase.load_options())
             .order_by(models.Showcase.created_at.desc())
             .offset(skip)
             .limit(limit)
@@ -555,14 +502,12 @@ async def list_showcases(
 
 
 @router.post("/{showcase_id}/share")
-async def create_share_link(
+def create_share_link(
     showcase_id: int,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    showcase = (
-        db.query(models.Showcase).filter(models.Showcase.id == showcase_id).first()
-    )
+    showcase = db.get(models.Showcase, showcase_id)
     if not showcase:
         raise HTTPException(status_code=404, detail="Showcase not found")
 
@@ -572,7 +517,7 @@ async def create_share_link(
 
 
 @router.put("/{showcase_id}/videos")
-async def update_showcase_videos(
+def update_showcase_videos(
     showcase_id: int,
     video_ids: List[int],
     db: Session = Depends(get_db),
@@ -609,7 +554,7 @@ async def update_showcase_videos(
 
 
 @router.put("/{showcase_id}/profile", response_model=schemas.ProjectShowcase)
-async def toggle_profile_link(
+def toggle_profile_link(
     showcase_id: int,
     include_profile: bool = True,  # Add parameter to control linking/unlinking
     db: Session = Depends(get_db),
@@ -645,7 +590,7 @@ async def toggle_profile_link(
                 db.query(models.ShowcaseContentLink)
                 .filter(
                     models.ShowcaseContentLink.showcase_id == showcase_id,
-                    models.ShowcaseContentLink.content_type == "profile",
+                    models.ShowcaseContentLink.profile_user_id.isnot(None),
                 )
                 .first()
             )
@@ -653,8 +598,7 @@ async def toggle_profile_link(
             if not existing_link:
                 profile_content_link = models.ShowcaseContentLink(
                     showcase_id=showcase_id,
-                    content_type="profile",
-                    content_id=current_user.id,
+                    profile_user_id=current_user.id,
                 )
                 db.add(profile_content_link)
         else:
@@ -664,7 +608,7 @@ async def toggle_profile_link(
             # Remove any existing profile content links
             db.query(models.ShowcaseContentLink).filter(
                 models.ShowcaseContentLink.showcase_id == showcase_id,
-                models.ShowcaseContentLink.content_type == "profile",
+                models.ShowcaseContentLink.profile_user_id.isnot(None),
             ).delete()
 
         db.commit()
@@ -677,7 +621,7 @@ async def toggle_profile_link(
 
 
 @router.put("/{showcase_id}/videos")
-async def update_showcase_videos(
+def update_showcase_videos(
     showcase_id: int,
     video_ids: Optional[List[int]] = None,  # Make optional to allow removing all videos
     db: Session = Depends(get_db),
@@ -697,7 +641,7 @@ async def update_showcase_videos(
         showcase.videos = []
         db.query(models.ShowcaseContentLink).filter(
             models.ShowcaseContentLink.showcase_id == showcase_id,
-            models.ShowcaseContentLink.content_type == "video",
+            models.ShowcaseContentLink.video_id.isnot(None),
         ).delete()
 
         if video_ids:
@@ -721,13 +665,14 @@ async def update_showcase_videos(
             showcase.videos = videos
 
             # Add new content links
-            for video in videos:
-                video_content_link = models.ShowcaseContentLink(
-                    showcase_id=showcase_id,
-                    content_type="video",
-                    content_id=video.id,
-                )
-                db.add(video_content_link)
+            bulk_insert(
+                db,
+                models.ShowcaseContentLink,
+                [
+                    {"showcase_id": showcase_id, "video_id": video.id}
+                    for video in videos
+                ],
+            )
 
         db.commit()
         db.refresh(showcase)
@@ -744,7 +689,7 @@ async def update_showcase_videos(
 @router.post(
     "/{showcase_id}/link-video/{video_id}", response_model=schemas.ProjectShowcase
 )
-async def link_video_to_showcase(
+def link_video_to_showcase(
     showcase_id: int,
     video_id: int,
     db: Session = Depends(get_db),
@@ -777,8 +722,7 @@ async def link_video_to_showcase(
     # Also create content link for consistency
     video_content_link = models.ShowcaseContentLink(
         showcase_id=showcase_id,
-        content_type="video",
-        content_id=video_id,
+        video_id=video_id,
     )
     db.add(video_content_link)
 
@@ -793,64 +737,13 @@ async def link_video_to_showcase(
 
 
 @router.get("/get-ranked", response_model=List[schemas.ProjectShowcase])
-async def get_ranked_showcases(
+def get_ranked_showcases(
     limit: Optional[int] = Query(10, ge=1, le=100), db: Session = Depends(get_db)
 ):
     """Get showcases ranked by an algorithm considering ratings, recency, and engagement.
     This is a public endpoint that doesn't require authentication."""
     try:
-        # SQL query using raw SQL for complex calculation
-        sql_query = text(
-            """
-            SELECT 
-                s.*,
-                (
-                    -- Rating score (weight: 0.5)
-                    (COALESCE(s.average_rating, 0) - 1) / 4 * 0.5 +
-                    
-                    -- Recency score (weight: 0.3)
-                    CASE
-                        WHEN MAX(EXTRACT(EPOCH FROM s.updated_at)) OVER() - MIN(EXTRACT(EPOCH FROM s.updated_at)) OVER() = 0
-                        THEN 0.3
-                        ELSE (EXTRACT(EPOCH FROM s.updated_at) - MIN(EXTRACT(EPOCH FROM s.updated_at)) OVER()) /
-                            (MAX(EXTRACT(EPOCH FROM s.updated_at)) OVER() - MIN(EXTRACT(EPOCH FROM s.updated_at)) OVER()) * 0.3
-                    END +
-                    
-                    -- Total ratings score (weight: 0.2)
-                    CASE
-                        WHEN MAX(LN(GREATEST(s.total_ratings, 1) + 1)) OVER() = 0
-                        THEN 0
-                        ELSE LN(GREATEST(s.total_ratings, 1) + 1) / MAX(LN(GREATEST(s.total_ratings, 1) + 1)) OVER() * 0.2
-                    END
-                ) AS ranking_score
-            FROM 
-                showcases s
-            ORDER BY 
-                ranking_score DESC
-            LIMIT :limit
-        """
-        )
-
-        # Execute the query
-        result = db.execute(sql_query, {"limit": limit})
-
-        # Convert the result to a list of Showcase objects
-        showcase_ids = [row.id for row in result]
-
-        # Handle case where no results were found
-        if not showcase_ids:
-            return []
-
-        # Fetch complete showcase objects with their relationships
-        showcases = (
-            db.query(models.Showcase).filter(models.Showcase.id.in_(showcase_ids)).all()
-        )
-
-        # Sort by the order of IDs from the ranked query
-        id_to_position = {id: idx for idx, id in enumerate(showcase_ids)}
-        showcases.sort(key=lambda x: id_to_position.get(x.id, float("inf")))
-
-        return showcases
+        return get_ranked_showcases_crud(db, limit)
 
     except Exception as e:
         logger.exception(f"Error fetching ranked showcases: {str(e)}")
@@ -861,73 +754,15 @@ async def get_ranked_showcases(
 
 
 @router.get("/ranked-projects/get", response_model=List[schemas.ProjectShowcase])
-async def get_ranked_showcases(
+def get_ranked_projects(
     limit: Optional[int] = Query(10, ge=1, le=100), db: Session = Depends(get_db)
 ):
-    """Get showcases ranked by an algorithm considering ratings, recency, and engagement.
-    This is a public endpoint that doesn't require authentication."""
-    try:
-        # SQL query using raw SQL for complex calculation
-        sql_query = text(
-            """
-            SELECT 
-                s.*,
-                (
-                    -- Rating score (weight: 0.5)
-                    (COALESCE(s.average_rating, 0) - 1) / 4 * 0.5 +
-                    
-                    -- Recency score (weight: 0.3)
-                    CASE
-                        WHEN MAX(EXTRACT(EPOCH FROM s.updated_at)) OVER() - MIN(EXTRACT(EPOCH FROM s.updated_at)) OVER() = 0
-                        THEN 0.3
-                        ELSE (EXTRACT(EPOCH FROM s.updated_at) - MIN(EXTRACT(EPOCH FROM s.updated_at)) OVER()) /
-                            (MAX(EXTRACT(EPOCH FROM s.updated_at)) OVER() - MIN(EXTRACT(EPOCH FROM s.updated_at)) OVER()) * 0.3
-                    END +
-                    
-                    -- Total ratings score (weight: 0.2)
-                    CASE
-                        WHEN MAX(LN(GREATEST(s.total_ratings, 1) + 1)) OVER() = 0
-                        THEN 0
-                        ELSE LN(GREATEST(s.total_ratings, 1) + 1) / MAX(LN(GREATEST(s.total_ratings, 1) + 1)) OVER() * 0.2
-                    END
-                ) AS ranking_score
-            FROM 
-                showcases s
-            ORDER BY 
-                ranking_score DESC
-            LIMIT :limit
-        """
-        )
-
-        # Execute the query
-        result = db.execute(sql_query, {"limit": limit}).fetchall()
-        showcase_id_to_rank = {row.id: idx for idx, row in enumerate(result)}
-        showcase_ids = list(showcase_id_to_rank.keys())
+    """Same ranking as /get-ranked, kept for existing clients."""
+    return get_ranked_showcases(limit=limit, db=db)
 
-        # Handle case where no results were found
-        if not showcase_ids:
-            return []
-
-        # Fetch complete showcase objects with their relationships
-        showcases = (
-            db.query(models.Showcase).filter(models.Showcase.id.in_(showcase_ids)).all()
-        )
-
-        # Sort by the order of IDs from the ranked query
-        id_to_position = {id: idx for idx, id in enumerate(showcase_ids)}
-        showcases.sort(key=lambda x: showcase_id_to_rank.get(x.id, float("inf")))
-
-        return showcases
-
-    except Exception as e:
-        logger.exception(f"Error fetching ranked showcases: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching ranked showcases: {str(e)}",
-        )
 
 @router.delete("/{showcase_id}/link-video/{video_id}")
-async def unlink_video_from_showcase(
+def unlink_video_from_showcase(
     showcase_id: int,
     video_id: int,
     db: Session = Depends(get_db),
@@ -966,8 +801,7 @@ async def unlink_video_from_showcase(
     # Remove content link
     db.query(models.ShowcaseContentLink).filter(
         models.ShowcaseContentLink.showcase_id == showcase_id,
-        models.ShowcaseContentLink.content_type == 'video',
-        models.ShowcaseContentLink.content_id == video_id
+        models.ShowcaseContentLink.video_id == video_id
     ).delete()
     
     # Commit changes
@@ -23,7 +23,10 @@ def get_public_developers(
     )
 
     if skills:
-        query = query.filter(models.DeveloperProfile.skills.ilike(f"%{skills}%"))
+        # Comma-separated, case-insensitive whole skills; profiles must list
+        # every requested skill (GIN @> on the lowercased copy)
+        wanted = [skill.lower() for skill in schemas.split_skills(skills)]
+        query = query.filter(models.DeveloperProfile.skills_normalized.contains(wanted))
 
     if min_experience is not None:
         query = query.filter(models.DeveloperProfile.experience_years >= min_experience)
@@ -11,7 +11,7 @@ from ..crud import rating as rating_crud
 from ..crud.project_showcase import (  # Make sure this import is correct
     create_project_showcase,
     get_project_showcase,
-    get_developer_showcases,
+    get_developer_showcases as get_developer_showcases_crud,
     update_project_showcase,
     delete_project_showcase,
 )
@@ -68,7 +68,7 @@ async def create_showcase(
             demo_url=demo_url,
         )
 
-        showcase = create_project_showcase(
+        showcase = await create_project_showcase(
             db=db,
             showcase=showcase_data,
             developer_id=current_user.id,
@@ -86,7 +86,7 @@ async def create_showcase(
 
 
 @router.post("/developer/{developer_id}", response_model=RatingResponse)
-async def rate_developer(
+def rate_developer(
     developer_id: int,
     rating_data: DeveloperRatingCreate,
     db: Session = Depends(get_db),
@@ -123,12 +123,11 @@ async def rate_developer(
 
 
 @router.get("/developer/{developer_id}", response_model=List[ProjectShowcase])
-async def get_developer_showcases(
+def get_developer_showcases(
     developer_id: int, skip: int = 0, limit: int = 100, db: Session = Depends(get_db)
 ):
     try:
-        # Fix: Don't call itself - use the imported crud function directly
-        showcases = await get_developer_showcases(db, developer_id, skip, limit)
+        showcases = get_developer_showcases_crud(db, developer_id, skip, limit)
         return showcases or []
     except Exception as e:
 
@@ -140,7 +139,7 @@ async def get_developer_showcases(
 @router.get(
     "/developer/{developer_id}/user-rating", response_model=Optional[DeveloperRatingOut]
 )
-async def get_user_rating(
+def get_user_rating(
     developer_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
@@ -159,7 +158,7 @@ async def get_user_rating(
 
 
 @router.get("/developer/{developer_id}/rating", response_model=DeveloperRatingStats)
-async def get_developer_rating_by_user_id(
+def get_developer_rating_by_user_id(
     developer_id: int, db: Session = Depends(get_db)
 ):
     # First get the developer profile using the user_id
@@ -184,13 +183,13 @@ async def get_developer_rating_by_user_id(
 
 
 @router.post("/showcase/{showcase_id}", response_model=RatingResponse)
-async def rate_showcase(
+def rate_showcase(
     showcase_id: int,
     rating_data: DeveloperRatingCreate,  # We can reuse this schema
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    showcase = db.query(Showcase).filter(Showcase.id == showcase_id).first()
+    showcase = db.get(Showcase, showcase_id)
     if not showcase:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Showcase not found"
@@ -223,8 +222,8 @@ async def rate_showcase(
 
 
 @router.get("/showcase/{showcase_id}", response_model=DeveloperRatingStats)
-async def get_showcase_rating(showcase_id: int, db: Session = Depends(get_db)):
-    showcase = db.query(Showcase).filter(Showcase.id == showcase_id).first()
+def get_showcase_rating(showcase_id: int, db: Session = Depends(get_db)):
+    showcase = db.get(Showcase, showcase_id)
     if not showcase:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Showcase not found"
@@ -235,12 +234,12 @@ async def get_showcase_rating(showcase_id: int, db: Session = Depends(get_db)):
 @router.get(
     "/showcase/{showcase_id}/user-rating", response_model=Optional[DeveloperRatingOut]
 )
-async def get_showcase_user_rating(
+def get_showcase_user_rating(
     showcase_id: int,
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user),
 ):
-    showcase = db.query(Showcase).filter(Showcase.id == showcase_id).first()
+    showcase = db.get(Showcase, showcase_id)
     if not showcase:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Showcase not found"
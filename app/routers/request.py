@@ -24,8 +24,10 @@ def get_public_requests(
 ):
     """Get public requests - no authentication required"""
     try:
+        # Fetch the owner's username in the same query instead of per row
         requests = (
-            db.query(models.Request)
+            db.query(models.Request, models.User.username.label("owner_username"))
+            .join(models.User, models.Request.user_id == models.User.id)
             .filter(models.Request.is_public == True)
             .order_by(models.Request.created_at.desc())
             .offset(skip)
@@ -34,10 +36,7 @@ def get_public_requests(
         )
 
         result = []
-        for request in requests:
-            owner = (
-                db.query(models.User).filter(models.User.id == request.user_id).first()
-            )
+        for request, owner_username in requests:
             # Match the exact schema fields
             request_dict = {
                 "id": request.id,
@@ -59,7 +58,7 @@ def get_public_requests(
                 "added_to_project_at": request.added_to_project_at,
                 "created_at": request.created_at,
                 "updated_at": request.updated_at,
-                "owner_username": owner.username if owner else "Unknown",
+                "owner_username": owner_username,
                 "shared_with_info": [],  # Empty list as it's public
             }
             result.append(request_dict)
@@ -21,7 +21,7 @@ class RoleSelection(schemas.BaseModel):
 
 # In your routes file (e.g., auth.py) add the following:
 @router.post("/auth/select-role", response_model=schemas.User)
-async def set_user_role(
+def set_user_role(
     role: schemas.UserRoleSelect,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
@@ -29,7 +29,7 @@ async def set_user_role(
     """
     Set the user's role (user_type) and mark that they no longer need role selection.
     """
-    user = db.query(models.User).filter(models.User.id == current_user.id).first()
+    user = db.get(models.User, current_user.id)
 
     if not user:
         raise HTTPException(
@@ -1,5 +1,6 @@
 # app/routers/snagged_requests.py
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import text
 from sqlalchemy.orm import Session, joinedload
 from typing import List
 from .. import models, schemas, database, oauth2
@@ -138,10 +139,17 @@ def create_snagged_request(
             )
 
         # Create all objects within a single transaction
-        new_snag = models.SnaggedRequest(
-            request_id=snag.request_id, developer_id=current_user.id
+        new_snag = database.upsert(
+            db,
+            models.SnaggedRequest,
+            {"request_id": snag.request_id, "developer_id": current_user.id},
+            ["developer_id", "request_id"],
+            index_where=text("is_active"),
         )
-        db.add(new_snag)
+        if not new_snag:
+            raise HTTPException(
+                status_code=409, detail="You have already snagged this request"
+            )
 
         conversation = models.Conversation(
             request_id=snag.request_id,
@@ -160,15 +168,18 @@ def create_snagged_request(
         db.add(message)
         db.flush()  # Get message ID
 
+        content_links = []
+
         # Handle profile link
         if snag.profile_link:
-            profile_link = models.ConversationContentLink(
-                conversation_id=conversation.id,
-                message_id=message.id,
-                content_type="profile",
-                content_id=current_user.id,
+            content_links.append(
+                {
+                    "conversation_id": conversation.id,
+                    "message_id": message.id,
+                    "video_id": None,
+                    "profile_user_id": current_user.id,
+                }
             )
-            db.add(profile_link)
 
         # Handle video links
         if snag.video_ids:
@@ -187,24 +198,19 @@ def create_snagged_request(
                     detail="One or more videos not found or not owned by user",
                 )
 
-            for video in videos:
-                video_link = models.ConversationContentLink(
-                    conversation_id=conversation.id,
-                    message_id=message.id,
-                    content_type="video",
-                    content_id=video.id,
-                )
-                db.add(video_link)
+            content_links.extend(
+                {
+                    "conversation_id": conversation.id,
+                    "message_id": message.id,
+                    "video_id": video.id,
+                    "profile_user_id": None,
+                }
+                for video in videos
+            )
 
+        database.bulk_insert(db, models.ConversationContentLink, content_links)
         db.commit()
 
-        # Verify content links were created
-        content_links = (
-            db.query(models.ConversationContentLink)
-            .filter(models.ConversationContentLink.message_id == message.id)
-            .all()
-        )
-
         # Return response with request details
         result = (
             db.query(models.SnaggedRequest)
@@ -159,7 +159,7 @@ async def upload_video(
 
 
 @router.post("/{video_id}/share")
-async def generate_share_link(
+def generate_share_link(
     video_id: int,
     project_url: Optional[str] = None,
     db: Session = Depends(get_db),
@@ -31,27 +31,33 @@ def vote(
             detail=f"Video with id {vote.video_id} does not exist",
         )
 
-    vote_query = db.query(models.Vote).filter(
-        models.Vote.video_id == vote.video_id, models.Vote.user_id == current_user.id
-    )
-    found_vote = vote_query.first()
-
     try:
         if vote.dir == 1:
-            if found_vote:
+            new_vote = database.upsert(
+                db,
+                models.Vote,
+                {"video_id": vote.video_id, "user_id": current_user.id},
+                ["user_id", "video_id"],
+            )
+            if not new_vote:
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT, detail="Already voted on this video"
                 )
-            new_vote = models.Vote(video_id=vote.video_id, user_id=current_user.id)
-            db.add(new_vote)
             db.commit()
             return {"message": "Successfully liked the video"}
         else:
-            if not found_vote:
+            deleted = (
+                db.query(models.Vote)
+                .filter(
+                    models.Vote.video_id == vote.video_id,
+                    models.Vote.user_id == current_user.id,
+                )
+                .delete(synchronize_session=False)
+            )
+            if not deleted:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Vote does not exist"
                 )
-            vote_query.delete(synchronize_session=False)
             db.commit()
             return {"message": "Successfully unliked the video"}
     except SQLAlchemyError as e:
@@ -75,27 +81,33 @@ def vote(
             detail=f"Video with id {vote.video_id} does not exist",
         )
 
-    vote_query = db.query(models.Vote).filter(
-        models.Vote.video_id == vote.video_id, models.Vote.user_id == current_user.id
-    )
-    found_vote = vote_query.first()
-
     try:
         if vote.dir == 1:
-            if found_vote:
+            new_vote = database.upsert(
+                db,
+                models.Vote,
+                {"video_id": vote.video_id, "user_id": current_user.id},
+                ["user_id", "video_id"],
+            )
+            if not new_vote:
                 raise HTTPException(
                     status_code=status.HTTP_409_CONFLICT, detail="Already voted on this video"
                 )
-            new_vote = models.Vote(video_id=vote.video_id, user_id=current_user.id)
-            db.add(new_vote)
             db.commit()
             return {"message": "Successfully liked the video"}
         else:
-            if not found_vote:
+            deleted = (
+                db.query(models.Vote)
+                .filter(
+                    models.Vote.video_id == vote.video_id,
+                    models.Vote.user_id == current_user.id,
+                )
+                .delete(synchronize_session=False)
+            )
+            if not deleted:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND, detail="Vote does not exist"
                 )
-            vote_query.delete(synchronize_session=False)
             db.commit()
             return {"message": "Successfully unliked the video"}
     except SQLAlchemyError as e:
@@ -243,13 +243,36 @@ class Achievement(BaseModel):
     url: Optional[str] = None
 
 
+def split_skills(v):
+    """
+    Accept skills as a list or the older comma-separated string. Entries are
+    trimmed and de-duplicated ignoring case, keeping the first spelling; null
+    clears the list.
+    """
+    if v is None:
+        return []
+    if isinstance(v, str):
+        v = v.split(",")
+    if not isinstance(v, list) or not all(isinstance(s, str) for s in v):
+        return v  # let the List[str] validation report it
+    skills = {}
+    for skill in (s.strip() for s in v):
+        if skill:
+            skills.setdefault(skill.lower(), skill)
+    return list(skills.values())
+
+
 # Then modify the profile models to use Dict instead of the custom types for now
 class DeveloperProfileCreate(BaseModel):
-    skills: str
+    skills: List[str] = []
     experience_years: int = Field(ge=0)
     bio: Optional[str] = None
     is_public: bool = False
 
+    @field_validator("skills", mode="before")
+    def skills_from_string(cls, v):
+        return split_skills(v)
+
 
 class ClientProfileCreate(BaseModel):
     company_name: Optional[str] = None
@@ -259,19 +282,23 @@ class ClientProfileCreate(BaseModel):
 
 
 class DeveloperProfileUpdate(BaseModel):
-    skills: Optional[str] = None
+    skills: Optional[List[str]] = None
     experience_years: Optional[int] = Field(None, ge=0)
     bio: Optional[str] = None
     is_public: Optional[bool] = None
     profile_image_url: Optional[str] = None
     total_projects: Optional[int] = Field(None, ge=0)
 
+    @field_validator("skills", mode="before")
+    def skills_from_string(cls, v):
+        return split_skills(v)
+
 
 class DeveloperProfilePublic(BaseModel):
     id: int
     user_id: int
     user: UserBasic  # Add this line to include user information
-    skills: str
+    skills: List[str]
     experience_years: int
     bio: Optional[str] = None
     profile_image_url: Optional[str] = None
@@ -293,7 +320,7 @@ class ClientProfileUpdate(BaseModel):
 class DeveloperProfileOut(BaseModel):
     id: int
     user_id: int
-    skills: str
+    skills: List[str]
     experience_years: int
     bio: Optional[str] = None
     is_public: bool